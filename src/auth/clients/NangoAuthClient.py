@@ -1,15 +1,38 @@
 import os
 import time
 import asyncio
+import functools
+import random
 import logging
+import threading
 import requests
 import httpx
 import jwt
-from typing import Optional, Dict, Any, Tuple, TypeVar, Generic, TypedDict
+import json
+from datetime import datetime
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Iterable,
+    List,
+    Tuple,
+    TypeVar,
+    Generic,
+    TypedDict,
+    Callable,
+)
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, Timeout
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 from auth.constants import (
-    SERVICE_NAME_MAP,
+    AUTH_TYPE_BY_SERVICE,
+    NANGO_NAME_BY_SERVICE,
     AUTH_TYPE_OAUTH2,
     AUTH_TYPE_UNAUTHENTICATED,
     AUTH_TYPE_API_KEY,
@@ -19,8 +42,198 @@ from .BaseAuthClient import BaseAuthClient, CredentialsT
 
 logger = logging.getLogger("nango-auth-client")
 
-# Retryable HTTP status codes
-_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Retryable 4xx status codes; every 5xx is treated as transient as well
+_RETRYABLE_CLIENT_ERRORS = (408, 429)
+
+# (connect, read) timeouts in seconds; connect fails fast so retries kick in
+_CONNECT_TIMEOUT = 3.05
+_READ_TIMEOUT = 10.0
+_PROVIDER_REQUEST_TIMEOUT = (_CONNECT_TIMEOUT, _READ_TIMEOUT)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _json_loads(content: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize a JSON request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode("utf-8")
+
+
+def _resolve_service(service_name: str) -> Tuple[str, str]:
+    """
+    Resolve an MCP service name to its Nango service name and auth type.
+
+    Unknown services map to themselves with the OAuth2 auth type.
+    """
+    return (
+        NANGO_NAME_BY_SERVICE.get(service_name, service_name),
+        AUTH_TYPE_BY_SERVICE.get(service_name, AUTH_TYPE_OAUTH2),
+    )
+
+
+# Retry policy for transient Nango errors
+_MAX_RETRIES = 3
+_INITIAL_BACKOFF = 1.0  # seconds
+_MAX_BACKOFF = 30.0  # seconds
+_BACKOFF_JITTER = 0.5
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    """Whether an HTTP status signals a transient Nango failure worth retrying."""
+    return status_code >= 500 or status_code in _RETRYABLE_CLIENT_ERRORS
+
+
+def _backoff_delay(
+    attempt: int,
+    initial_backoff: float = _INITIAL_BACKOFF,
+    max_backoff: float = _MAX_BACKOFF,
+    jitter: float = _BACKOFF_JITTER,
+) -> float:
+    """Exponential backoff with multiplicative jitter for the given attempt (0-based)."""
+    delay = min(max_backoff, initial_backoff * (2**attempt))
+    return delay * (1 + random.random() * jitter)
+
+
+def _request_with_backoff(
+    http: Any,
+    method: str,
+    url: str,
+    log_context: str,
+    max_retries: int = _MAX_RETRIES,
+    initial_backoff: float = _INITIAL_BACKOFF,
+    **kwargs: Any,
+) -> Optional[requests.Response]:
+    """
+    Send an HTTP request, retrying transient failures with exponential backoff.
+
+    Only retryable status codes (408/429/5xx) and connection errors/timeouts are
+    retried; any other response is returned to the caller as-is.
+
+    Args:
+        http: Object exposing ``request`` (a requests.Session or the requests module)
+        method: HTTP method
+        url: Request URL
+        log_context: Prefix used in log messages
+        max_retries: Maximum number of attempts
+        initial_backoff: Delay before the first retry, doubled on every attempt
+
+    Returns:
+        The last Response received, or None if every attempt failed at the
+        network level or with a retryable status.
+    """
+    last_error = None
+
+    for attempt in range(max_retries):
+        try:
+            response = http.request(method, url, **kwargs)
+
+            if not _is_retryable_status(response.status_code):
+                return response
+
+            # The body of a transient error is not needed, so it is never decoded
+            last_error = f"HTTP {response.status_code}"
+            logger.warning(
+                "%s retryable error (attempt %d/%d): %s",
+                log_context,
+                attempt + 1,
+                max_retries,
+                last_error,
+            )
+        except (ConnectionError, Timeout) as e:
+            last_error = str(e)
+            logger.warning(
+                "%s network error (attempt %d/%d): %s",
+                log_context,
+                attempt + 1,
+                max_retries,
+                last_error,
+            )
+
+        if attempt < max_retries - 1:
+            time.sleep(_backoff_delay(attempt, initial_backoff))
+
+    logger.error(
+        "%s all %d retries exhausted: %s", log_context, max_retries, last_error
+    )
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _load_signing_key(private_key: str) -> Tuple[Any, str]:
+    """
+    Return the (key, algorithm) pair used to sign connection JWTs.
+
+    PEM-encoded private keys are deserialized once and reused with RS256, so
+    repeat signings skip the ASN.1 parse. Any other secret keeps the HS256
+    default that PyJWT applies when no algorithm is given.
+    """
+    if private_key.lstrip().startswith("-----BEGIN"):
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+        return load_pem_private_key(private_key.encode(), password=None), "RS256"
+    return private_key.encode(), "HS256"
+
+
+def _identity(credentials: Any) -> Any:
+    return credentials
+
+
+def _call_to_json(credentials: Any) -> Any:
+    return credentials.to_json()
+
+
+@functools.lru_cache(maxsize=32)
+def _serializer_for(credentials_type: type) -> Callable[[Any], Any]:
+    """
+    Return the function that converts credentials of this type to a JSON body.
+
+    Objects exposing ``to_json`` (e.g. google.oauth2 Credentials) are converted;
+    dicts and anything else are sent as-is. Resolved once per type.
+    """
+    if hasattr(credentials_type, "to_json"):
+        return _call_to_json
+    return _identity
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_provider(url: str, secret_key: str, nango_service_name: str) -> dict:
+    """
+    Fetch provider information from Nango.
+
+    Provider config is static for the lifetime of the process, so results are
+    memoized per (url, secret_key, provider). Failures raise and are not cached.
+    """
+    logger.info("[get_oauth_config] url: %s", url)
+
+    response = _request_with_backoff(
+        requests,
+        "GET",
+        url,
+        f"[get_oauth_config] {nango_service_name}:",
+        headers={"Authorization": f"Bearer {secret_key}"},
+        timeout=_PROVIDER_REQUEST_TIMEOUT,
+    )
+
+    if response is None:
+        raise ValueError(f"Failed to get provider info for {nango_service_name}")
+
+    if not response.ok:
+        logger.error(
+            "Failed to get provider info for %s: %s",
+            nango_service_name,
+            response.text,
+        )
+        raise ValueError(f"Failed to get provider info for {nango_service_name}")
+
+    return _json_loads(response.content)
 
 
 class JWTTokenResponse(TypedDict):
@@ -51,31 +264,82 @@ class NangoAuthClient(BaseAuthClient[CredentialsT]):
     Can work with any type of credentials that can be managed through Nango.
     """
 
-    # Class-level cache shared across all instances: {(service_name, connection_id): (timestamp, credentials_data)}
+    # Class-level cache shared across all instances: {(service_name, connection_id): (expires_at, credentials_data)}
     _cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+    _cache_lock = threading.Lock()
     _cache_ttl: float = float(os.environ.get("NANGO_CACHE_TTL", "300"))  # 5 min default
-
-    _REQUEST_TIMEOUT: int = 10  # seconds
-    _MAX_RETRIES: int = 3
-    _INITIAL_BACKOFF: float = 1.0
-
-    def __init__(self, secret_key: Optional[str] = None, host: Optional[str] = None):
+    # Stop serving cached credentials this long before the token itself expires
+    _CACHE_EXPIRY_MARGIN: float = 60.0  # seconds
+
+    _MAX_RETRIES: int = _MAX_RETRIES
+    _INITIAL_BACKOFF: float = _INITIAL_BACKOFF
+
+    # Connection pool sizing for the keep-alive session to the Nango API
+    _POOL_CONNECTIONS: int = 10
+    _POOL_MAXSIZE: int = 20
+
+    def __init__(
+        self,
+        secret_key: Optional[str] = None,
+        host: Optional[str] = None,
+        connect_timeout: float = _CONNECT_TIMEOUT,
+        read_timeout: float = _READ_TIMEOUT,
+    ):
         """
         Initialize the Nango auth client
 
         Args:
             secret_key: Nango secret key for service authentication
             host: Nango API host URL (defaults to Nango Cloud)
+            connect_timeout: Seconds to wait for a connection to Nango
+            read_timeout: Seconds to wait for Nango to send a response
         """
         self.secret_key = secret_key or os.environ.get("NANGO_SECRET_KEY")
         self.host = host or os.environ.get("NANGO_HOST", "https://api.nango.dev")
         self.api_base_url = f"{self.host}"
+        self._timeout = (connect_timeout, read_timeout)
+        self._async_timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+
+        # Constant URL fragments and headers are built once per client
+        self._conn_url_tmpl = (
+            f"{self.api_base_url}/connection/{{conn}}?provider_config_key={{svc}}"
+        )
+        self._provider_url_tmpl = f"{self.api_base_url}/provider/{{svc}}"
+        self._save_url_tmpl = f"{self.api_base_url}/connection/{{svc}}/{{conn}}"
+        self._auth_headers = {"Authorization": f"Bearer {self.secret_key}"}
 
         if not self.secret_key:
             logger.warning(
                 "Missing Nango secret key. Some functionality may be limited."
             )
 
+        # Reuse keep-alive connections to Nango instead of paying a TCP+TLS
+        # handshake on every credential lookup
+        self._session = requests.Session()
+        self._session.headers.update(self._auth_headers)
+        adapter = HTTPAdapter(
+            pool_connections=self._POOL_CONNECTIONS,
+            pool_maxsize=self._POOL_MAXSIZE,
+            max_retries=0,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "NangoAuthClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def clear_provider_cache() -> None:
+        """Drop all memoized provider configs (mainly for tests)."""
+        _fetch_provider.cache_clear()
+
     def _map_service_name(self, service_name: str) -> str:
         """
         Map MCP service name to Nango service name
@@ -89,9 +353,7 @@ class NangoAuthClient(BaseAuthClient[CredentialsT]):
         """
         # If the service name is in our mapping, use the mapped value
         # Otherwise, use the original service name as is
-        return SERVICE_NAME_MAP.get(service_name, {}).get(
-            "nango_service_name", service_name
-        )
+        return _resolve_service(service_name)[0]
 
     def _get_jwt_token(
         self, service_name: str, tenant_id: str, private_key: str, access_token: str
@@ -100,20 +362,18 @@ class NangoAuthClient(BaseAuthClient[CredentialsT]):
         Get JWT token from Nango API
         """
         # Generate JWT token
-        expires_at = time.time() + 3600
+        now = time.time()
+        expires_at = now + 3600
         payload = {
             "iss": service_name,
             "aud": service_name,
             "acc": access_token,
             "sub": tenant_id,
-            "iat": time.time(),
+            "iat": now,
             "exp": expires_at,
         }
-        jwt_token = jwt.encode(
-            payload,
-            private_key,
-            # algorithm="RS256"
-        )
+        signing_key, algorithm = _load_signing_key(private_key)
+        jwt_token = jwt.encode(payload, signing_key, algorithm=algorithm)
         return {"access_token": jwt_token, "expires_at": expires_at}
 
     def _resolve_jwt_from_metadata(
@@ -132,156 +392,259 @@ class NangoAuthClient(BaseAuthClient[CredentialsT]):
 
         if not tenant_id or not private_key or not access_token:
             logger.error(
-                f"Missing required metadata fields for {service_name} connection {connection_id}"
+                "Missing required metadata fields for %s connection %s",
+                service_name,
+                connection_id,
             )
             return None
 
         logger.info(
-            f"[_resolve_jwt_from_metadata] generating JWT for tenant {tenant_id}"
+            "[_resolve_jwt_from_metadata] generating JWT for tenant %s", tenant_id
         )
         return self._get_jwt_token(service_name, tenant_id, private_key, access_token)
 
+    def _build_credentials(
+        self,
+        body: dict,
+        auth_type: str,
+        service_name: str,
+        connection_id: str,
+    ) -> Optional[CredentialsT]:
+        """
+        Build the credentials object for a parsed Nango connection payload.
+
+        The caller parses the response body once and passes it in, so each
+        auth-type branch reads from the same dict.
+        """
+        if auth_type == AUTH_TYPE_OAUTH2:
+            # Return the credentials data as a dictionary
+            # The caller is responsible for converting to the appropriate credentials type
+            credentials: NangoStandardConnectionCredentials = body.get("credentials")
+            credentials["metadata"] = body.get("metadata", {})
+            return credentials
+
+        if auth_type == AUTH_TYPE_API_KEY:
+            credentials: NangoApiKeyConnectionCredentials = (
+                body.get("credentials") or {}
+            )
+            if credentials.get("apiKey"):
+                return credentials
+            # Fallback: legacy connection migrated from UNAUTHENTICATED
+            return (
+                self._resolve_jwt_from_metadata(body, service_name, connection_id)
+                or credentials
+            )
+
+        if auth_type == AUTH_TYPE_UNAUTHENTICATED:
+            return self._resolve_jwt_from_metadata(body, service_name, connection_id)
+
+        return None
+
+    @staticmethod
+    def _credentials_expiry(credentials_data: Any) -> Optional[float]:
+        """
+        Return the epoch expiry of a credentials payload, if it carries one.
+
+        OAuth2 connections report ``expires_at`` as an ISO-8601 string, while
+        JWTs generated from metadata carry it as an epoch float.
+        """
+        if not isinstance(credentials_data, dict):
+            return None
+        expires_at = credentials_data.get("expires_at")
+        if isinstance(expires_at, (int, float)):
+            return float(expires_at)
+        if isinstance(expires_at, str):
+            try:
+                return datetime.fromisoformat(
+                    expires_at.replace("Z", "+00:00")
+                ).timestamp()
+            except ValueError:
+                return None
+        return None
+
     def _get_cached_credentials(
         self, service_name: str, connection_id: str
     ) -> Optional[CredentialsT]:
         """Return cached credentials if present and not expired."""
         cache_key = (service_name, connection_id)
-        entry = NangoAuthClient._cache.get(cache_key)
-        if entry is None:
-            return None
-        cached_at, credentials_data = entry
-        if time.time() - cached_at > NangoAuthClient._cache_ttl:
-            del NangoAuthClient._cache[cache_key]
-            return None
+        with NangoAuthClient._cache_lock:
+            entry = NangoAuthClient._cache.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, credentials_data = entry
+            if time.time() >= expires_at:
+                del NangoAuthClient._cache[cache_key]
+                return None
         logger.info(
-            f"[get_user_credentials] cache hit for {service_name} connection {connection_id}"
+            "[get_user_credentials] cache hit for %s connection %s",
+            service_name,
+            connection_id,
         )
         return credentials_data
 
     def _set_cached_credentials(
         self, service_name: str, connection_id: str, credentials_data: CredentialsT
     ) -> None:
-        """Store credentials in the class-level cache."""
-        NangoAuthClient._cache[(service_name, connection_id)] = (
-            time.time(),
-            credentials_data,
-        )
+        """
+        Store credentials in the class-level cache.
+
+        Entries live for at most the configured TTL, and never past the
+        credentials' own expiry minus a safety margin.
+        """
+        now = time.time()
+        expires_at = now + NangoAuthClient._cache_ttl
+        credentials_expiry = self._credentials_expiry(credentials_data)
+        if credentials_expiry is not None:
+            expires_at = min(
+                expires_at, credentials_expiry - NangoAuthClient._CACHE_EXPIRY_MARGIN
+            )
+        if expires_at <= now:
+            return
+        with NangoAuthClient._cache_lock:
+            NangoAuthClient._cache[(service_name, connection_id)] = (
+                expires_at,
+                credentials_data,
+            )
+
+    def invalidate(self, service_name: str, connection_id: str) -> None:
+        """
+        Drop cached credentials for a connection, e.g. after the provider
+        rejected them with a 401.
+        """
+        with NangoAuthClient._cache_lock:
+            NangoAuthClient._cache.pop((service_name, connection_id), None)
 
     def _fetch_connection_with_retries(
-        self, url: str, headers: Dict[str, str], service_name: str, connection_id: str
+        self, url: str, service_name: str, connection_id: str
     ) -> Optional[requests.Response]:
         """
         Fetch connection details from Nango API with retries and exponential backoff.
 
-        Returns the Response on success, or None for permanent failures (e.g. 404).
-        Raises an exception if all retries are exhausted on transient errors.
+        Returns the Response on success, or None for permanent failures (e.g. 404)
+        and when all retries are exhausted on transient errors.
         """
-        delay = self._INITIAL_BACKOFF
-        last_error = None
-
-        for attempt in range(self._MAX_RETRIES):
-            try:
-                response = requests.get(
-                    url, headers=headers, timeout=self._REQUEST_TIMEOUT
-                )
-
-                if response.status_code == 200:
-                    return response
-
-                if response.status_code == 404:
-                    logger.info(
-                        f"No connection found for {service_name} connection {connection_id}"
-                    )
-                    return None
+        response = _request_with_backoff(
+            self._session,
+            "GET",
+            url,
+            f"[get_user_credentials] {service_name} connection {connection_id}:",
+            max_retries=self._MAX_RETRIES,
+            initial_backoff=self._INITIAL_BACKOFF,
+            timeout=self._timeout,
+        )
 
-                if response.status_code in _RETRYABLE_STATUS_CODES:
-                    last_error = f"HTTP {response.status_code}: {response.text}"
-                    logger.warning(
-                        f"[get_user_credentials] retryable error (attempt {attempt + 1}/{self._MAX_RETRIES}) "
-                        f"for {service_name} connection {connection_id}: {last_error}"
-                    )
-                else:
-                    # Non-retryable error (4xx other than 404/429)
-                    logger.error(
-                        f"Failed to get connection details for {service_name} connection {connection_id}: {response.text}"
-                    )
-                    return None
+        if response is None:
+            return None
 
-            except (ConnectionError, Timeout) as e:
-                last_error = str(e)
-                logger.warning(
-                    f"[get_user_credentials] network error (attempt {attempt + 1}/{self._MAX_RETRIES}) "
-                    f"for {service_name} connection {connection_id}: {last_error}"
-                )
+        if response.ok:
+            return response
 
-            if attempt < self._MAX_RETRIES - 1:
-                time.sleep(delay)
-                delay *= 2
+        if response.status_code == 404:
+            logger.info(
+                "No connection found for %s connection %s", service_name, connection_id
+            )
+            return None
 
+        # Non-retryable error (4xx other than 404/408/429)
         logger.error(
-            f"All {self._MAX_RETRIES} retries exhausted for {service_name} connection {connection_id}: {last_error}"
+            "Failed to get connection details for %s connection %s: %s",
+            service_name,
+            connection_id,
+            response.text,
         )
         return None
 
     async def _async_fetch_connection_with_retries(
-        self, url: str, headers: Dict[str, str], service_name: str, connection_id: str
+        self,
+        url: str,
+        headers: Dict[str, str],
+        service_name: str,
+        connection_id: str,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> Optional[httpx.Response]:
         """
         Async version of _fetch_connection_with_retries.
 
         Uses httpx.AsyncClient and asyncio.sleep to avoid blocking the event loop.
         This prevents SSE stream stalls on the pf-mcp server when Nango is slow.
+        When http_client is given its connection pool is reused, otherwise a
+        short-lived client is opened per attempt.
         """
-        delay = self._INITIAL_BACKOFF
         last_error = None
 
         for attempt in range(self._MAX_RETRIES):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        url, headers=headers, timeout=self._REQUEST_TIMEOUT
+                if http_client is not None:
+                    response = await http_client.get(
+                        url, headers=headers, timeout=self._async_timeout
                     )
+                else:
+                    async with httpx.AsyncClient() as client:
+                        response = await client.get(
+                            url, headers=headers, timeout=self._async_timeout
+                        )
 
-                if response.status_code == 200:
+                if response.is_success:
                     return response
 
                 if response.status_code == 404:
                     logger.info(
-                        f"No connection found for {service_name} connection {connection_id}"
+                        "No connection found for %s connection %s",
+                        service_name,
+                        connection_id,
                     )
                     return None
 
-                if response.status_code in _RETRYABLE_STATUS_CODES:
-                    last_error = f"HTTP {response.status_code}: {response.text}"
+                if _is_retryable_status(response.status_code):
+                    last_error = f"HTTP {response.status_code}"
                     logger.warning(
-                        f"[get_user_credentials] retryable error (attempt {attempt + 1}/{self._MAX_RETRIES}) "
-                        f"for {service_name} connection {connection_id}: {last_error}"
+                        "[get_user_credentials] retryable error (attempt %d/%d) "
+                        "for %s connection %s: %s",
+                        attempt + 1,
+                        self._MAX_RETRIES,
+                        service_name,
+                        connection_id,
+                        last_error,
                     )
                 else:
-                    # Non-retryable error (4xx other than 404/429)
+                    # Non-retryable error (4xx other than 404/408/429)
                     logger.error(
-                        f"Failed to get connection details for {service_name} connection {connection_id}: {response.text}"
+                        "Failed to get connection details for %s connection %s: %s",
+                        service_name,
+                        connection_id,
+                        response.text,
                     )
                     return None
 
             except (httpx.ConnectError, httpx.TimeoutException) as e:
                 last_error = str(e)
                 logger.warning(
-                    f"[get_user_credentials] network error (attempt {attempt + 1}/{self._MAX_RETRIES}) "
-                    f"for {service_name} connection {connection_id}: {last_error}"
+                    "[get_user_credentials] network error (attempt %d/%d) "
+                    "for %s connection %s: %s",
+                    attempt + 1,
+                    self._MAX_RETRIES,
+                    service_name,
+                    connection_id,
+                    last_error,
                 )
 
             if attempt < self._MAX_RETRIES - 1:
-                await asyncio.sleep(delay)
-                delay *= 2
+                await asyncio.sleep(_backoff_delay(attempt, self._INITIAL_BACKOFF))
 
         logger.error(
-            f"All {self._MAX_RETRIES} retries exhausted for {service_name} connection {connection_id}: {last_error}"
+            "All %d retries exhausted for %s connection %s: %s",
+            self._MAX_RETRIES,
+            service_name,
+            connection_id,
+            last_error,
         )
         return None
 
     async def async_get_user_credentials(
-        self, service_name: str, connection_id: str
+        self,
+        service_name: str,
+        connection_id: str,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> Optional[CredentialsT]:
         """
         Async version of get_user_credentials. Preferred in async contexts (MCP servers).
@@ -300,48 +663,27 @@ class NangoAuthClient(BaseAuthClient[CredentialsT]):
             return cached
 
         try:
-            nango_service_name = self._map_service_name(service_name)
-            auth_type = SERVICE_NAME_MAP.get(service_name, {}).get(
-                "auth_type", AUTH_TYPE_OAUTH2
-            )
-            url = f"{self.api_base_url}/connection/{connection_id}?provider_config_key={nango_service_name}"
-            logger.info(f"[async_get_user_credentials] url: {url}")
-            headers = {"Authorization": f"Bearer {self.secret_key}"}
+            nango_service_name, auth_type = _resolve_service(service_name)
+            url = self._conn_url_tmpl.format(conn=connection_id, svc=nango_service_name)
+            logger.info("[async_get_user_credentials] url: %s", url)
 
             response = await self._async_fetch_connection_with_retries(
-                url, headers, service_name, connection_id
+                url,
+                self._auth_headers,
+                service_name,
+                connection_id,
+                http_client=http_client,
             )
 
             if response is None:
                 return None
 
-            result = None
-
-            if auth_type == AUTH_TYPE_OAUTH2:
-                credentials: NangoStandardConnectionCredentials = response.json().get(
-                    "credentials"
-                )
-                metadata = response.json().get("metadata", {})
-                credentials["metadata"] = metadata
-                result = credentials
-            elif auth_type == AUTH_TYPE_API_KEY:
-                credentials: NangoApiKeyConnectionCredentials = (
-                    response.json().get("credentials") or {}
-                )
-                if credentials.get("apiKey"):
-                    result = credentials
-                else:
-                    # Fallback: legacy connection migrated from UNAUTHENTICATED
-                    result = (
-                        self._resolve_jwt_from_metadata(
-                            response.json(), service_name, connection_id
-                        )
-                        or credentials
-                    )
-            elif auth_type == AUTH_TYPE_UNAUTHENTICATED:
-                result = self._resolve_jwt_from_metadata(
-                    response.json(), service_name, connection_id
-                )
+            result = self._build_credentials(
+                _json_loads(response.content),
+                auth_type,
+                service_name,
+                connection_id,
+            )
 
             if result is not None:
                 self._set_cached_credentials(service_name, connection_id, result)
@@ -354,6 +696,35 @@ class NangoAuthClient(BaseAuthClient[CredentialsT]):
             )
             return None
 
+    async def async_get_user_credentials_many(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        max_connections: int = 50,
+    ) -> List[Optional[CredentialsT]]:
+        """
+        Fetch credentials for many (service_name, connection_id) pairs concurrently.
+
+        All lookups share one httpx.AsyncClient connection pool, so N lookups
+        complete in roughly one round trip instead of N sequential ones.
+
+        Args:
+            pairs: Iterable of (service_name, connection_id) tuples
+            max_connections: Upper bound on concurrent connections to Nango
+
+        Returns:
+            Credentials (or None) for each pair, in input order
+        """
+        limits = httpx.Limits(max_connections=max_connections)
+        async with httpx.AsyncClient(limits=limits) as http_client:
+            return await asyncio.gather(
+                *(
+                    self.async_get_user_credentials(
+                        service_name, connection_id, http_client=http_client
+                    )
+                    for service_name, connection_id in pairs
+                )
+            )
+
     def get_user_credentials(
         self, service_name: str, connection_id: str
     ) -> Optional[CredentialsT]:
@@ -377,52 +748,25 @@ class NangoAuthClient(BaseAuthClient[CredentialsT]):
             return cached
 
         try:
-            # Map the service name to Nango's service name
-            nango_service_name = self._map_service_name(service_name)
-            auth_type = SERVICE_NAME_MAP.get(service_name, {}).get(
-                "auth_type", AUTH_TYPE_OAUTH2
-            )
+            # Map the service name to Nango's service name and auth type
+            nango_service_name, auth_type = _resolve_service(service_name)
             # Use the Nango API to get connection details
-            url = f"{self.api_base_url}/connection/{connection_id}?provider_config_key={nango_service_name}"
-            logger.info(f"[get_user_credentials] url: {url}")
-            headers = {"Authorization": f"Bearer {self.secret_key}"}
+            url = self._conn_url_tmpl.format(conn=connection_id, svc=nango_service_name)
+            logger.info("[get_user_credentials] url: %s", url)
 
             response = self._fetch_connection_with_retries(
-                url, headers, service_name, connection_id
+                url, service_name, connection_id
             )
 
             if response is None:
                 return None
 
-            result = None
-
-            if auth_type == AUTH_TYPE_OAUTH2:
-                # Return the credentials data as a dictionary
-                # The caller is responsible for converting to the appropriate credentials type
-                credentials: NangoStandardConnectionCredentials = response.json().get(
-                    "credentials"
-                )
-                metadata = response.json().get("metadata", {})
-                credentials["metadata"] = metadata
-                result = credentials
-            elif auth_type == AUTH_TYPE_API_KEY:
-                credentials: NangoApiKeyConnectionCredentials = (
-                    response.json().get("credentials") or {}
-                )
-                if credentials.get("apiKey"):
-                    result = credentials
-                else:
-                    # Fallback: legacy connection migrated from UNAUTHENTICATED
-                    result = (
-                        self._resolve_jwt_from_metadata(
-                            response.json(), service_name, connection_id
-                        )
-                        or credentials
-                    )
-            elif auth_type == AUTH_TYPE_UNAUTHENTICATED:
-                result = self._resolve_jwt_from_metadata(
-                    response.json(), service_name, connection_id
-                )
+            result = self._build_credentials(
+                _json_loads(response.content),
+                auth_type,
+                service_name,
+                connection_id,
+            )
 
             if result is not None:
                 self._set_cached_credentials(service_name, connection_id, result)
@@ -453,20 +797,12 @@ class NangoAuthClient(BaseAuthClient[CredentialsT]):
             # Map the service name to Nango's service name
             nango_service_name = self._map_service_name(service_name)
 
-            # Get provider information from Nango
-            url = f"{self.api_base_url}/provider/{nango_service_name}"
-            logger.info(f"[get_oauth_config] url: {url}")
-            headers = {"Authorization": f"Bearer {self.secret_key}"}
-
-            response = requests.get(url, headers=headers)
-
-            if response.status_code != 200:
-                logger.error(
-                    f"Failed to get provider info for {service_name}: {response.text}"
-                )
-                raise ValueError(f"Failed to get provider info for {service_name}")
-
-            provider_data = response.json()
+            # Get provider information from Nango (cached per process)
+            provider_data = _fetch_provider(
+                self._provider_url_tmpl.format(svc=nango_service_name),
+                self.secret_key,
+                nango_service_name,
+            )
 
             # Extract OAuth configuration from provider data
             oauth_config = {
@@ -502,34 +838,62 @@ class NangoAuthClient(BaseAuthClient[CredentialsT]):
             nango_service_name = self._map_service_name(service_name)
 
             # Use the Nango API to update connection credentials
-            url = f"{self.api_base_url}/connection/{nango_service_name}/{connection_id}"
-            logger.info(f"[save_user_credentials] url: {url}")
-            headers = {
-                "Authorization": f"Bearer {self.secret_key}",
-                "Content-Type": "application/json",
-            }
+            url = self._save_url_tmpl.format(svc=nango_service_name, conn=connection_id)
+            logger.info("[save_user_credentials] url: %s", url)
 
             # Convert credentials to JSON if needed
-            if hasattr(credentials, "to_json"):
-                credentials_data = credentials.to_json()
-            elif isinstance(credentials, dict):
-                credentials_data = credentials
-            else:
-                # Try to serialize the object directly
-                credentials_data = credentials
+            credentials_data = _serializer_for(type(credentials))(credentials)
+
+            response = _request_with_backoff(
+                self._session,
+                "PUT",
+                url,
+                f"[save_user_credentials] {service_name} connection {connection_id}:",
+                max_retries=self._MAX_RETRIES,
+                initial_backoff=self._INITIAL_BACKOFF,
+                data=_json_dumps(credentials_data),
+                headers=_JSON_HEADERS,
+                timeout=self._timeout,
+            )
 
-            response = requests.put(url, headers=headers, json=credentials_data)
+            if response is None:
+                return
 
-            if response.status_code != 200:
+            if not response.ok:
                 logger.error(
-                    f"Failed to save credentials for {service_name} connection {connection_id}: {response.text}"
+                    "Failed to save credentials for %s connection %s: %s",
+                    service_name,
+                    connection_id,
+                    response.text,
                 )
                 return
 
             logger.info(
-                f"Successfully saved credentials for {service_name} connection {connection_id}"
+                "Successfully saved credentials for %s connection %s",
+                service_name,
+                connection_id,
             )
         except Exception as e:
             logger.error(
                 f"Error saving credentials for {service_name} connection {connection_id}: {str(e)}"
             )
+
+
+_default_client: Optional[NangoAuthClient] = None
+_default_lock = threading.Lock()
+
+
+def get_default_client() -> NangoAuthClient:
+    """
+    Return the process-wide NangoAuthClient, creating it on first use.
+
+    Prefer this over constructing a client per request: the shared instance
+    keeps one keep-alive session, so TLS connections to Nango are reused
+    across MCP requests. Configuration comes from NANGO_SECRET_KEY/NANGO_HOST.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                _default_client = NangoAuthClient()
+    return _default_client
@@ -1,3 +1,18 @@
+import sys
+from types import MappingProxyType
+from typing import NamedTuple
+
+__all__ = [
+    "AUTH_TYPE_OAUTH2",
+    "AUTH_TYPE_API_KEY",
+    "AUTH_TYPE_TBA",
+    "AUTH_TYPE_UNAUTHENTICATED",
+    "ServiceInfo",
+    "SERVICE_NAME_MAP",
+    "AUTH_TYPE_BY_SERVICE",
+    "NANGO_NAME_BY_SERVICE",
+]
+
 # Service name mapping from MCP to Nango
 # This maps the service names used in MCP to their equivalents in Nango
 
@@ -6,54 +21,47 @@ AUTH_TYPE_API_KEY = "API_KEY"
 AUTH_TYPE_TBA = "tba"
 AUTH_TYPE_UNAUTHENTICATED = "unauthenticated"
 
+
+class ServiceInfo(NamedTuple):
+    """Nango integration details for an MCP service."""
+
+    nango_service_name: str
+    auth_type: str
+
+
 SERVICE_NAME_MAP = {
     # Google services
-    "gsheets": {"nango_service_name": "google-sheet", "auth_type": AUTH_TYPE_OAUTH2},
-    "gcalendar": {
-        "nango_service_name": "google-calendar",
-        "auth_type": AUTH_TYPE_OAUTH2,
-    },
-    "gmail": {"nango_service_name": "google-mail", "auth_type": AUTH_TYPE_OAUTH2},
-    "gdocs": {"nango_service_name": "google-docs", "auth_type": AUTH_TYPE_OAUTH2},
-    "gdrive": {"nango_service_name": "google-drive", "auth_type": AUTH_TYPE_OAUTH2},
-    "gmaps": {"nango_service_name": "google", "auth_type": AUTH_TYPE_OAUTH2},
-    "gmeet": {"nango_service_name": "google", "auth_type": AUTH_TYPE_OAUTH2},
-    "firestore": {
-        "nango_service_name": "google-firestore",
-        "auth_type": AUTH_TYPE_OAUTH2,
-    },
-    "notion": {"nango_service_name": "notion", "auth_type": AUTH_TYPE_OAUTH2},
-    "tldv": {"nango_service_name": "tldv", "auth_type": AUTH_TYPE_API_KEY},
-    "peakflo": {
-        "nango_service_name": "peakflo",
-        "auth_type": AUTH_TYPE_API_KEY,
-    },
-    "peakflo-api-key": {
-        "nango_service_name": "peakflo-api-key",
-        "auth_type": AUTH_TYPE_API_KEY,
-    },
-    "netsuite": {
-        "nango_service_name": "netsuite-tba",
-        "auth_type": AUTH_TYPE_TBA,
-    },
-    "xero": {
-        "nango_service_name": "xero",
-        "auth_type": AUTH_TYPE_OAUTH2,
-    },
+    "gsheets": ServiceInfo("google-sheet", AUTH_TYPE_OAUTH2),
+    "gcalendar": ServiceInfo("google-calendar", AUTH_TYPE_OAUTH2),
+    "gmail": ServiceInfo("google-mail", AUTH_TYPE_OAUTH2),
+    "gdocs": ServiceInfo("google-docs", AUTH_TYPE_OAUTH2),
+    "gdrive": ServiceInfo("google-drive", AUTH_TYPE_OAUTH2),
+    "gmaps": ServiceInfo("google", AUTH_TYPE_OAUTH2),
+    "gmeet": ServiceInfo("google", AUTH_TYPE_OAUTH2),
+    "firestore": ServiceInfo("google-firestore", AUTH_TYPE_OAUTH2),
+    "notion": ServiceInfo("notion", AUTH_TYPE_OAUTH2),
+    "tldv": ServiceInfo("tldv", AUTH_TYPE_API_KEY),
+    "peakflo": ServiceInfo("peakflo", AUTH_TYPE_API_KEY),
+    "peakflo-api-key": ServiceInfo("peakflo-api-key", AUTH_TYPE_API_KEY),
+    "netsuite": ServiceInfo("netsuite-tba", AUTH_TYPE_TBA),
+    "xero": ServiceInfo("xero", AUTH_TYPE_OAUTH2),
     # Google Search Console
-    "gsc": {
-        "nango_service_name": "google-search-console",
-        "auth_type": AUTH_TYPE_OAUTH2,
-    },
+    "gsc": ServiceInfo("google-search-console", AUTH_TYPE_OAUTH2),
     # Google Analytics 4
-    "ga4": {
-        "nango_service_name": "google-analytics",
-        "auth_type": AUTH_TYPE_OAUTH2,
-    },
+    "ga4": ServiceInfo("google-analytics", AUTH_TYPE_OAUTH2),
     # Slack user-level token integration (xoxp- tokens for posting as the user)
-    "slack-user": {
-        "nango_service_name": "slack-user",
-        "auth_type": AUTH_TYPE_OAUTH2,
-    },
+    "slack-user": ServiceInfo("slack-user", AUTH_TYPE_OAUTH2),
     # # Add more mappings as needed
 }
+
+# Intern the service names so hot-path lookups can short-circuit on identity,
+# and expose the map read-only
+SERVICE_NAME_MAP = MappingProxyType(
+    {sys.intern(name): info for name, info in SERVICE_NAME_MAP.items()}
+)
+
+# Flattened single-probe views of SERVICE_NAME_MAP
+AUTH_TYPE_BY_SERVICE = {name: info.auth_type for name, info in SERVICE_NAME_MAP.items()}
+NANGO_NAME_BY_SERVICE = {
+    name: info.nango_service_name for name, info in SERVICE_NAME_MAP.items()
+}
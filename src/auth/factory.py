@@ -1,16 +1,76 @@
 import os
 import logging
-from typing import Optional, TypeVar, Type
+import functools
+from typing import Callable, Dict, Optional, TypeVar, Type
 from dotenv import load_dotenv
 
-from auth.constants import SERVICE_NAME_MAP
+from auth.constants import AUTH_TYPE_BY_SERVICE, AUTH_TYPE_OAUTH2
 from .clients.BaseAuthClient import BaseAuthClient
 
 logger = logging.getLogger("auth-factory")
 
 T = TypeVar("T", bound=BaseAuthClient)
 
-load_dotenv()
+
+@functools.cache
+def _ensure_dotenv_loaded() -> None:
+    """Load .env into os.environ once, on first use rather than at import."""
+    load_dotenv()
+
+
+@functools.cache
+def _environment() -> str:
+    """The auth environment, which is fixed for the lifetime of the process."""
+    _ensure_dotenv_loaded()
+    return os.environ.get("ENVIRONMENT", "local").lower()
+
+
+def _build_gumloop(api_key: Optional[str]) -> BaseAuthClient:
+    from .clients.GumloopAuthClient import GumloopAuthClient
+
+    return GumloopAuthClient(api_key=api_key)
+
+
+def _build_nango(api_key: Optional[str]) -> BaseAuthClient:
+    from .clients.NangoAuthClient import get_default_client
+
+    # Share one client (and its connection pool) across the process;
+    # it reads NANGO_SECRET_KEY and NANGO_HOST from the environment
+    return get_default_client()
+
+
+def _build_local(api_key: Optional[str]) -> BaseAuthClient:
+    from .clients.LocalAuthClient import LocalAuthClient
+
+    return LocalAuthClient()
+
+
+# Auth client builder per ENVIRONMENT value
+_ENV_DISPATCH: Dict[str, Callable[[Optional[str]], BaseAuthClient]] = {
+    "gumloop": _build_gumloop,
+    "nango": _build_nango,
+    "local": _build_local,
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _create_auth_client_cached(
+    client_type: Optional[Type[T]], api_key: Optional[str]
+) -> BaseAuthClient:
+    # If client_type is specified, use it directly
+    if client_type:
+        return client_type()
+
+    # Otherwise, determine from environment
+    environment = _environment()
+    builder = _ENV_DISPATCH.get(environment)
+    if builder is None:
+        logger.warning(
+            f"Unknown ENVIRONMENT '{environment}', falling back to local auth client"
+        )
+        builder = _build_local
+
+    return builder(api_key)
 
 
 def create_auth_client(
@@ -19,6 +79,9 @@ def create_auth_client(
     """
     Factory function to create the appropriate auth client based on environment
 
+    Clients are cached per (client_type, api_key), so repeat calls return the
+    same instance; use clear_auth_client_cache() to reset.
+
     Args:
         client_type: Optional specific client class to instantiate
         api_key: Optional API key for authentication
@@ -26,31 +89,12 @@ def create_auth_client(
     Returns:
         An instance of the appropriate BaseAuthClient implementation
     """
-    # If client_type is specified, use it directly
-    if client_type:
-        return client_type()
+    return _create_auth_client_cached(client_type, api_key)
 
-    # Otherwise, determine from environment
-    environment = os.environ.get("ENVIRONMENT", "local").lower()
-
-    if environment == "gumloop":
-        from .clients.GumloopAuthClient import GumloopAuthClient
-
-        return GumloopAuthClient(api_key=api_key)
-
-    if environment == "nango":
-        from .clients.NangoAuthClient import NangoAuthClient
-
-        # Get Nango-specific configuration
-        secret_key = os.environ.get("NANGO_SECRET_KEY")
-        host = os.environ.get("NANGO_HOST")
 
-        return NangoAuthClient(secret_key=secret_key, host=host)
-
-    # Default to local file auth client
-    from .clients.LocalAuthClient import LocalAuthClient
-
-    return LocalAuthClient()
+def clear_auth_client_cache() -> None:
+    """Drop every cached auth client so the next create_auth_client call builds anew"""
+    _create_auth_client_cached.cache_clear()
 
 
 def get_auth_type(service_name: str) -> str:
@@ -64,4 +108,4 @@ def get_auth_type(service_name: str) -> str:
         Nango auth type. If the service name is not in the mapping,
         "oauth2" is returned.
     """
-    return SERVICE_NAME_MAP.get(service_name, {}).get("auth_type", "oauth2")
+    return AUTH_TYPE_BY_SERVICE.get(service_name, AUTH_TYPE_OAUTH2)
@@ -1,21 +1,29 @@
 import os
 import sys
 from typing import Optional, Iterable, Dict, Any, List
-import json
 import asyncio
-from typing import Callable, TypeVar
+import re
+import time
+from datetime import datetime, timezone
+from typing import Callable, Tuple, TypeVar
 
 # Add both project root and src directory to Python path
 # Get the project root directory and add to path
 project_root = os.path.abspath(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 )
-sys.path.insert(0, project_root)
-sys.path.insert(0, os.path.join(project_root, "src"))
+# Skip the inserts when the paths are already present (e.g. re-imports in workers)
+for path in (project_root, os.path.join(project_root, "src")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
 
 import logging
 from pathlib import Path
+from urllib.parse import parse_qs, quote
 import aiohttp
+import orjson
+from cachetools import TTLCache
+from google.auth import default as google_auth_default
 from google.cloud import firestore
 from google.oauth2 import service_account
 
@@ -31,6 +39,7 @@ from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
+from src.auth.factory import create_auth_client
 from src.utils.google.util import (
     authenticate_and_save_credentials,
     get_credentials,
@@ -86,24 +95,6 @@ async def with_exponential_backoff(
             delay = min(delay * backoff_factor, max_delay)
 
 
-def convert_input_to_value(value):
-    """Convert input value to Firestore value format"""
-    if isinstance(value, str):
-        return {"stringValue": value}
-    elif isinstance(value, bool):
-        return {"booleanValue": value}
-    elif isinstance(value, int):
-        return {"integerValue": str(value)}
-    elif isinstance(value, float):
-        return {"doubleValue": value}
-    elif isinstance(value, list):
-        return {
-            "arrayValue": {"values": [convert_input_to_value(item) for item in value]}
-        }
-    else:
-        return {"stringValue": str(value)}
-
-
 def firestore_document_to_json(doc):
     """Convert Firestore document to JSON format"""
     if hasattr(doc, "to_dict"):
@@ -111,41 +102,83 @@ def firestore_document_to_json(doc):
     return doc
 
 
+def document_with_id(doc):
+    """
+    Convert a document snapshot to a dict carrying its ID under "_id"
+
+    to_dict() already returns a fresh dict, so the ID is added in place rather
+    than merged into a copy; nested values are serialized later by to_json.
+    """
+    doc_data = doc.to_dict()
+    doc_data["_id"] = doc.id
+    return doc_data
+
+
+def _serialize_bytes(obj):
+    # Convert bytes to string
+    try:
+        return obj.decode("utf-8")
+    except UnicodeDecodeError:
+        return obj.hex()
+
+
+def _serialize_datetime(obj):
+    # Other Firestore datetime objects - check if timestamp is callable
+    try:
+        return obj.timestamp().isoformat()
+    except (AttributeError, TypeError):
+        # If timestamp() fails, try other methods
+        if hasattr(obj, "isoformat"):
+            return obj.isoformat()
+        return str(obj)
+
+
+def _resolve_serializer(obj) -> Callable[[Any], Any]:
+    """Pick the conversion for an object's type by probing its attributes"""
+    if isinstance(obj, datetime):
+        # Firestore timestamps (DatetimeWithNanoseconds) and plain datetimes
+        return datetime.isoformat
+    elif isinstance(obj, bytes):
+        return _serialize_bytes
+    elif hasattr(obj, "to_dict"):
+        return lambda o: o.to_dict()
+    elif hasattr(obj, "path"):
+        # DocumentReference or CollectionReference
+        return lambda o: str(o.path)
+    elif hasattr(obj, "latitude") and hasattr(obj, "longitude"):
+        # GeoPoint
+        return lambda o: {"latitude": o.latitude, "longitude": o.longitude}
+    elif hasattr(obj, "to_rfc3339"):
+        return lambda o: o.to_rfc3339()
+    elif hasattr(obj, "timestamp") and callable(getattr(obj, "timestamp")):
+        return _serialize_datetime
+    return str
+
+
+# JSON-native scalars are returned unchanged without any lookup
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Conversion per type, resolved on first encounter so the attribute probes
+# run once per type instead of once per value
+_SERIALIZER_CACHE: Dict[type, Callable[[Any], Any]] = {}
+
+
 def convert_firestore_to_serializable(obj):
-    """Convert Firestore objects to JSON serializable format"""
+    """
+    Convert a Firestore value to JSON serializable format
+
+    Used as the orjson ``default=`` hook, so it only sees values orjson cannot
+    encode natively; dicts and lists are walked by orjson itself.
+    """
+    obj_type = type(obj)
+    if obj_type in _ATOMIC_TYPES:
+        return obj
+
     try:
-        if hasattr(obj, "to_dict"):
-            return convert_firestore_to_serializable(obj.to_dict())
-        elif isinstance(obj, bytes):
-            # Convert bytes to string
-            try:
-                return obj.decode("utf-8")
-            except UnicodeDecodeError:
-                return obj.hex()
-        elif hasattr(obj, "path"):
-            # DocumentReference or CollectionReference
-            return str(obj.path)
-        elif hasattr(obj, "to_rfc3339"):
-            # Firestore Timestamp objects (DatetimeWithNanoseconds)
-            return obj.to_rfc3339()
-        elif hasattr(obj, "timestamp") and callable(getattr(obj, "timestamp")):
-            # Other Firestore datetime objects - check if timestamp is callable
-            try:
-                return obj.timestamp().isoformat()
-            except (AttributeError, TypeError):
-                # If timestamp() fails, try other methods
-                if hasattr(obj, "isoformat"):
-                    return obj.isoformat()
-                return str(obj)
-        elif isinstance(obj, dict):
-            return {
-                key: convert_firestore_to_serializable(value)
-                for key, value in obj.items()
-            }
-        elif isinstance(obj, list):
-            return [convert_firestore_to_serializable(item) for item in obj]
-        else:
-            return obj
+        serializer = _SERIALIZER_CACHE.get(obj_type)
+        if serializer is None:
+            serializer = _SERIALIZER_CACHE[obj_type] = _resolve_serializer(obj)
+        return serializer(obj)
     except Exception as e:
         # Log the error and return string representation as fallback
         logger.warning(
@@ -154,9 +187,40 @@ def convert_firestore_to_serializable(obj):
         return str(obj)
 
 
+# Responses are read by MCP clients, not people, so they are not indented
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def to_json(obj) -> str:
+    """Serialize a response payload as compact JSON using orjson"""
+    return orjson.dumps(
+        obj, default=convert_firestore_to_serializable, option=_JSON_OPTIONS
+    ).decode()
+
+
+async def stream_documents_to_json(docs) -> str:
+    """
+    Serialize streamed document snapshots as a JSON array
+
+    Each document is encoded as it arrives, so the result set is never held
+    as a list of dicts alongside its serialized form.
+    """
+    buffer = bytearray(b"[")
+    async for doc in docs:
+        if len(buffer) > 1:
+            buffer += b","
+        buffer += orjson.dumps(
+            document_with_id(doc),
+            default=convert_firestore_to_serializable,
+            option=_JSON_OPTIONS,
+        )
+    buffer += b"]"
+    return buffer.decode()
+
+
 def parse_select_fields(value) -> Optional[List[str]]:
     """
-    Parse optional field projection for query_collection.
+    Parse optional field projection for query_collection and document reads.
 
     Accepts a comma-separated string (e.g. "code,name,sourceData.code") or a list
     of field path strings. Document id is always included separately as `_id` in
@@ -181,9 +245,96 @@ def parse_select_fields(value) -> Optional[List[str]]:
     return [field for field in fields if field not in reserved]
 
 
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp string
+
+    fromisoformat only accepts a trailing "Z" from Python 3.11, so it is
+    rewritten to "+00:00" first; strings without one are parsed unchanged.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+# A date, optionally followed by a time: "2023-10-23" or "2023-10-23T10:00..."
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}|$)")
+
+
+def _looks_like_iso(value) -> bool:
+    """Check that a value is shaped like an ISO 8601 date before parsing it"""
+    return isinstance(value, str) and _ISO_DATE_RE.match(value) is not None
+
+
+def _parse_bool(value) -> bool:
+    """Parse a boolean filter value, which the tool schema passes as a string"""
+    if isinstance(value, str):
+        if value.lower() in ("true", "false"):
+            return value.lower() == "true"
+        raise ValueError(f"not a boolean: {value}")
+    return bool(value)
+
+
+# compare_value keys, in the order they are checked for a filter's value
+_FILTER_VALUE_KEYS = (
+    "string_value",
+    "integer_value",
+    "double_value",
+    "boolean_value",
+    "date_value",
+    "string_array_value",
+)
+
+# Coercion applied to a filter value, keyed by its compare_value key
+_FILTER_VALUE_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    "date_value": _parse_iso,
+    "boolean_value": _parse_bool,
+}
+
+# Field-name fragments that mark a string filter value as a timestamp
+_TIMESTAMP_FIELD_RE = re.compile(
+    r"_at|time|date|created|updated|modified", re.IGNORECASE
+)
+
+# Tool filter operators mapped to Firestore query operators
+_FILTER_OPERATORS = {
+    "EQUAL": "==",
+    "NOT_EQUAL": "!=",
+    "LESS_THAN": "<",
+    "LESS_THAN_OR_EQUAL": "<=",
+    "GREATER_THAN": ">",
+    "GREATER_THAN_OR_EQUAL": ">=",
+    "ARRAY_CONTAINS": "array_contains",
+    "ARRAY_CONTAINS_ANY": "array_contains_any",
+    "IN": "in",
+    "NOT_IN": "not_in",
+}
+
+
+def _filter_value(compare_value: Dict[str, Any]) -> Tuple[Optional[str], Any]:
+    """Return the (key, value) of the first non-null value in compare_value"""
+    for key in _FILTER_VALUE_KEYS:
+        value = compare_value.get(key)
+        if value is not None:
+            return key, value
+    # Fall back to any other key for callers that don't follow the schema
+    for key, value in compare_value.items():
+        if value is not None:
+            return key, value
+    return None, None
+
+
+# Values that process_document_data passes through unchanged
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
 def process_document_data(data, client):
     """Process document data to handle complex field types"""
     if isinstance(data, dict):
+        # Flat payloads of primitives have nothing to convert
+        if all(isinstance(value, _PRIMITIVE_TYPES) for value in data.values()):
+            return data
+
         processed = {}
         for key, value in data.items():
             if isinstance(value, dict) and "_type" in value and "_value" in value:
@@ -194,18 +345,7 @@ def process_document_data(data, client):
                 if field_type == "timestamp":
                     # Convert ISO string to datetime object
                     try:
-                        from datetime import datetime
-
-                        if "T" in field_value and (
-                            "Z" in field_value
-                            or "+" in field_value
-                            or "-" in field_value[-6:]
-                        ):
-                            processed[key] = datetime.fromisoformat(
-                                field_value.replace("Z", "+00:00")
-                            )
-                        else:
-                            processed[key] = datetime.fromisoformat(field_value)
+                        processed[key] = _parse_iso(field_value)
                         logger.info(
                             f"Converted timestamp field '{key}' with value '{field_value}'"
                         )
@@ -239,8 +379,143 @@ def process_document_data(data, client):
         return data
 
 
+# Firestore rejects write batches with more than 500 operations
+MAX_BATCH_WRITES = 500
+# Cap on batches committed at once so large bulk writes don't exceed deadlines
+MAX_CONCURRENT_BATCHES = 40
+
+
+async def commit_writes_in_batches(client, writes) -> List[Optional[str]]:
+    """
+    Commit writes in batches of up to MAX_BATCH_WRITES operations
+
+    Batches are committed concurrently, at most MAX_CONCURRENT_BATCHES at a time.
+
+    Args:
+        client: Firestore client
+        writes: List of (operation, document_reference, data) tuples, where
+            operation is a WriteBatch method name such as "set" or "update"
+
+    Returns:
+        A list aligned with writes holding None for committed writes or the
+        error message of the batch that failed
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+    async def commit(chunk):
+        batch = client.batch()
+        for operation, doc_ref, data in chunk:
+            getattr(batch, operation)(doc_ref, data)
+        async with semaphore:
+            await batch.commit()
+
+    chunks = [
+        writes[i : i + MAX_BATCH_WRITES]
+        for i in range(0, len(writes), MAX_BATCH_WRITES)
+    ]
+    outcomes = await asyncio.gather(
+        *(commit(chunk) for chunk in chunks), return_exceptions=True
+    )
+
+    errors = []
+    for chunk, outcome in zip(chunks, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Failed to commit batch of {len(chunk)} writes: {outcome}")
+            errors.extend([str(outcome)] * len(chunk))
+        else:
+            errors.extend([None] * len(chunk))
+    return errors
+
+
+# Reuse Firestore clients across tool calls; entries are dropped after the TTL
+# or shortly before their OAuth token expires, whichever comes first
+CLIENT_CACHE_TTL = 300.0  # seconds
+CLIENT_CACHE_MAXSIZE = 256
+CLIENT_EXPIRY_MARGIN = 60.0  # seconds
+_client_locks: Dict[tuple, asyncio.Lock] = {}
+
+
+class _ClientCache(TTLCache):
+    """TTLCache of (expires_at, client) entries that drops build locks with them
+
+    Dropped clients are not closed: a handler may still be running an RPC on
+    one, so its channel is released when the last reference is collected.
+    """
+
+    def _discard(self, key) -> None:
+        lock = _client_locks.get(key)
+        if lock is not None and not lock.locked():
+            del _client_locks[key]
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for key, _ in expired:
+            self._discard(key)
+        return expired
+
+    def popitem(self):
+        key, entry = super().popitem()
+        self._discard(key)
+        return key, entry
+
+    def clear(self):
+        # Pop entries one by one so every lock goes through _discard
+        while True:
+            try:
+                self.popitem()
+            except KeyError:
+                break
+
+
+_client_cache: _ClientCache = _ClientCache(
+    maxsize=CLIENT_CACHE_MAXSIZE, ttl=CLIENT_CACHE_TTL, timer=time.time
+)
+
+
+def _client_cache_expiry(client) -> float:
+    """Time after which a cached client must be rebuilt"""
+    expires_at = time.time() + CLIENT_CACHE_TTL
+    credentials = getattr(client, "_credentials", None)
+    expiry = getattr(credentials, "expiry", None)
+    if expiry is not None:
+        # google-auth stores expiry as a naive UTC datetime
+        token_expires_at = expiry.replace(tzinfo=timezone.utc).timestamp()
+        expires_at = min(expires_at, token_expires_at - CLIENT_EXPIRY_MARGIN)
+    return expires_at
+
+
 async def create_firestore_client(
     user_id, api_key=None, project_id=None, use_emulator=False
+):
+    """Get a cached Firestore client, creating one on a miss or after expiry"""
+    key = (user_id, api_key, project_id, use_emulator)
+
+    entry = _client_cache.get(key)
+    if entry is not None and entry[0] > time.time():
+        return entry[1]
+
+    # Per-key lock so concurrent calls for the same user build a single client
+    lock = _client_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            entry = _client_cache.get(key)
+            if entry is not None and entry[0] > time.time():
+                return entry[1]
+
+            client = await _build_firestore_client(
+                user_id, api_key, project_id, use_emulator
+            )
+            _client_cache[key] = (_client_cache_expiry(client), client)
+            return client
+    finally:
+        # Don't keep the lock around when the build failed or the entry is gone
+        if key not in _client_cache and not lock.locked():
+            if _client_locks.get(key) is lock:
+                del _client_locks[key]
+
+
+async def _build_firestore_client(
+    user_id, api_key=None, project_id=None, use_emulator=False
 ):
     """Create a Firestore client"""
     try:
@@ -253,11 +528,9 @@ async def create_firestore_client(
 
         if not final_project_id:
             try:
-                from src.auth.factory import create_auth_client
-
                 auth_client = create_auth_client(api_key=api_key)
-                credentials_data = auth_client.get_user_credentials(
-                    SERVICE_NAME, user_id
+                credentials_data = await asyncio.to_thread(
+                    auth_client.get_user_credentials, SERVICE_NAME, user_id
                 )
 
                 if credentials_data and isinstance(credentials_data, dict):
@@ -277,9 +550,7 @@ async def create_firestore_client(
         # Fallback to Application Default Credentials project
         if not final_project_id:
             try:
-                from google.auth import default
-
-                _, default_project = default()
+                _, default_project = await asyncio.to_thread(google_auth_default)
                 final_project_id = default_project
                 logger.info(
                     f"Using project_id from Application Default Credentials: {final_project_id}"
@@ -292,8 +563,10 @@ async def create_firestore_client(
         if use_emulator:
             os.environ["FIRESTORE_EMULATOR_HOST"] = "localhost:8080"
 
-        # Create Firestore client with OAuth2 credentials
-        client = firestore.Client(project=final_project_id, credentials=credentials)
+        # Create async Firestore client so RPCs yield to the event loop
+        client = firestore.AsyncClient(
+            project=final_project_id, credentials=credentials
+        )
 
         # Store metadata in client for potential future use (non-breaking)
         if metadata:
@@ -305,6 +578,351 @@ async def create_firestore_client(
         raise
 
 
+# Tool definitions are static, so they are built once at import
+TOOLS = [
+    Tool(
+        name="query_collection",
+        description="Query a Firestore collection with advanced filtering, ordering, and pagination. Use this to search for documents that match specific criteria, sort results, and limit the number of returned documents. Perfect for finding specific data within a collection.\n\nUsage Examples:\n- Find all users with status 'active': collection_path='users', filters=[{field:'status', op:'EQUAL', compare_value:{string_value:'active'}}]\n- Get recent orders: collection_path='orders', order={orderBy:'created_at', orderByDirection:'DESCENDING'}, limit=20\n- Search by email: collection_path='users', filters=[{field:'email', op:'EQUAL', compare_value:{string_value:'user@example.com'}}]\n- Filter by timestamp (using date_value): collection_path='orders', filters=[{field:'created_at', op:'GREATER_THAN', compare_value:{date_value:'2023-10-23T00:00:00Z'}}]\n- Get orders from last week: collection_path='orders', filters=[{field:'created_at', op:'GREATER_THAN_OR_EQUAL', compare_value:{date_value:'2023-10-16T00:00:00Z'}}]\n- Return only selected fields: collection_path='companies/tenant/accounts', select_fields='code,name,accountName'",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database": {
+                    "type": "string",
+                    "description": "Database id to use. Defaults to `(default)` if unspecified.",
+                },
+                "collection_path": {
+                    "type": "string",
+                    "description": "The collection path to query. Examples: 'users', 'companies', 'orders', 'users/123/orders' (for subcollections)",
+                },
+                "filters": {
+                    "type": "array",
+                    "description": "Array of filter conditions to apply to the query. Each filter specifies a field, operator, and value to match against. For timestamp fields, use ISO 8601 format (e.g., '2023-10-23T19:30:16.740Z') or RFC3339 format.",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "compare_value": {
+                                "type": "object",
+                                "description": "One and only one value may be specified per filters object.",
+                                "properties": {
+                                    "string_value": {
+                                        "type": "string",
+                                        "description": "The string value to compare against. For timestamp fields, use ISO 8601 format (e.g., '2023-10-23T19:30:16.740Z').",
+                                    },
+                                    "boolean_value": {
+                                        "type": "string",
+                                        "description": "The boolean value to compare against.",
+                                    },
+                                    "string_array_value": {
+                                        "type": "array",
+                                        "items": {"type": "string"},
+                                        "description": "The string value to compare against.",
+                                    },
+                                    "integer_value": {
+                                        "type": "number",
+                                        "description": "The integer value to compare against.",
+                                    },
+                                    "double_value": {
+                                        "type": "number",
+                                        "description": "The double value to compare against.",
+                                    },
+                                    "date_value": {
+                                        "type": "string",
+                                        "description": "The date/timestamp value to compare against. Use ISO 8601 format (e.g., '2023-10-23T19:30:16.740Z'). This will be automatically converted to a datetime object.",
+                                    },
+                                },
+                            },
+                            "field": {
+                                "type": "string",
+                                "description": "The document field to filter against (e.g., 'name', 'email', 'created_at', 'updated_at'). For timestamp fields, use ISO 8601 format in compare_value.",
+                            },
+                            "op": {
+                                "type": "string",
+                                "enum": [
+                                    "OPERATOR_UNSPECIFIED",
+                                    "LESS_THAN",
+                                    "LESS_THAN_OR_EQUAL",
+                                    "GREATER_THAN",
+                                    "GREATER_THAN_OR_EQUAL",
+                                    "EQUAL",
+                                    "NOT_EQUAL",
+                                    "ARRAY_CONTAINS",
+                                    "ARRAY_CONTAINS_ANY",
+                                    "IN",
+                                    "NOT_IN",
+                                ],
+                                "description": "The comparison operator to use (EQUAL, NOT_EQUAL, GREATER_THAN, LESS_THAN, etc.). For timestamp fields, use GREATER_THAN, LESS_THAN, GREATER_THAN_OR_EQUAL, LESS_THAN_OR_EQUAL for date ranges.",
+                            },
+                        },
+                        "required": ["compare_value", "field", "op"],
+                    },
+                },
+            },
+            "order": {
+                "type": "object",
+                "description": "Optional sorting configuration. Specifies which field to sort by and the direction (ascending/descending).",
+                "properties": {
+                    "orderBy": {
+                        "type": "string",
+                        "description": "The field name to sort by (e.g., 'created_at', 'name', 'price')",
+                    },
+                    "orderByDirection": {
+                        "type": "string",
+                        "enum": ["ASCENDING", "DESCENDING"],
+                        "description": "Sort direction: ASCENDING (A-Z, 1-9) or DESCENDING (Z-A, 9-1)",
+                    },
+                },
+                "required": ["orderBy", "orderByDirection"],
+            },
+            "limit": {
+                "type": "number",
+                "description": "Maximum number of documents to return (default: 10, max recommended: 100 for performance)",
+            },
+            "select_fields": {
+                "type": "string",
+                "description": "Optional comma-separated list of document field paths to return (e.g. 'code,name,accountName,sourceData.code'). When set, Firestore returns only these fields plus the document id as `_id`. Omit to return full documents.",
+            },
+            "use_emulator": {
+                "type": "boolean",
+                "default": False,
+                "description": "Target the Firestore emulator if true.",
+            },
+            "required": ["collection_path"],
+        },
+        # outputSchema={
+        #     "type": "array",
+        #     "items": {"type": "object"},
+        #     "description": "Array of Firestore documents matching the query",
+        # },
+    ),
+    Tool(
+        name="get_document",
+        description="Retrieve a specific Firestore document by its full path. Use this when you know the exact document ID and want to fetch a single document's data. Perfect for getting detailed information about a specific record.\n\nUsage Examples:\n- Get user profile: document_path='users/123'\n- Get company details: document_path='companies/abc-456'\n- Get order information: document_path='orders/order-789'",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_path": {
+                    "type": "string",
+                    "description": "Full path to the document. Examples: 'users/123', 'companies/abc-456', 'orders/order-789'",
+                },
+                "select_fields": {
+                    "type": "string",
+                    "description": "Optional comma-separated list of document field paths to return (e.g. 'code,name'). When set, Firestore returns only these fields plus the document id as `_id`. Omit to return full documents.",
+                },
+                "database": {
+                    "type": "string",
+                    "description": "Database id to use. Defaults to `(default)` if unspecified.",
+                },
+                "use_emulator": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Target the Firestore emulator if true.",
+                },
+            },
+            "required": ["document_path"],
+        },
+        # outputSchema={
+        #     "type": "object",
+        #     "description": "Firestore document data",
+        # },
+    ),
+    Tool(
+        name="get_documents",
+        description="Retrieve several Firestore documents by their full paths in a single round trip. Use this instead of repeated get_document calls when you already know the document IDs. Documents are returned in the order requested; missing documents are returned with an error field.\n\nUsage Examples:\n- Get several users: document_paths=['users/123', 'users/456']\n- Get an order and its customer: document_paths=['orders/order-789', 'customers/abc-456']",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Full paths of the documents to fetch. Examples: ['users/123', 'companies/abc-456']",
+                },
+                "select_fields": {
+                    "type": "string",
+                    "description": "Optional comma-separated list of document field paths to return (e.g. 'code,name'). When set, Firestore returns only these fields plus the document id as `_id`. Omit to return full documents.",
+                },
+                "database": {
+                    "type": "string",
+                    "description": "Database id to use. Defaults to `(default)` if unspecified.",
+                },
+                "use_emulator": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Target the Firestore emulator if true.",
+                },
+            },
+            "required": ["document_paths"],
+        },
+    ),
+    Tool(
+        name="list_collections",
+        description="List all top-level collections in the Firestore database. Use this to discover what collections are available before querying or to get an overview of your database structure. Returns collection names only.\n\nUsage Examples:\n- Discover available collections: No parameters needed\n- Get database overview: Use before querying to see what data is available\n- Check if a collection exists: Look for specific collection names in the results",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database": {
+                    "type": "string",
+                    "description": "Database id to use. Defaults to `(default)` if unspecified.",
+                },
+                "use_emulator": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Target the Firestore emulator if true.",
+                },
+            },
+        },
+        # outputSchema={
+        #     "type": "array",
+        #     "items": {"type": "string"},
+        #     "description": "Array of collection names",
+        # },
+    ),
+    Tool(
+        name="create_document",
+        description="Create a new document in a Firestore collection. Use this to add new records to your database. The document_data must contain actual field values - it cannot be empty. Supports complex field types like timestamps and document references using special syntax. To create more than one document, use create_documents instead.\n\nIMPORTANT: document_data must contain real data with field names and values. Do not send empty objects.\n\nUsage Examples:\n- Create a user: collection_path='users', document_data={name:'John Doe', email:'john@example.com', created_at:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}}\n- Create with reference: collection_path='orders', document_data={user_id:{_type:'reference', _value:'users/123'}, amount:99.99, status:'pending'}\n- Simple document: collection_path='products', document_data={name:'Widget', price:29.99, active:true, category:'electronics'}\n- With nested data: collection_path='profiles', document_data={user:{name:'Jane', age:30}, settings:{theme:'dark', notifications:true}}",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection_path": {
+                    "type": "string",
+                    "description": "The collection path where the document will be created. Examples: 'users', 'orders', 'products'",
+                },
+                "document_data": {
+                    "type": "object",
+                    "additionalProperties": True,
+                    "description": "REQUIRED: The document data to create. Must contain actual field names and values (cannot be empty). For complex types, use {_type: 'timestamp', _value: 'ISO_string'} for timestamps and {_type: 'reference', _value: 'path/to/doc'} for references. Example: {name:'John', age:30, created_at:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}}",
+                },
+                "document_id": {
+                    "type": "string",
+                    "description": "Optional custom document ID. If not provided, Firestore will auto-generate one.",
+                },
+                "database": {
+                    "type": "string",
+                    "description": "Database id to use. Defaults to `(default)` if unspecified.",
+                },
+                "use_emulator": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Target the Firestore emulator if true.",
+                },
+            },
+            "required": ["collection_path", "document_data"],
+        },
+    ),
+    Tool(
+        name="update_document",
+        description="Update an existing document in Firestore. Use this to modify existing records. The document_data must contain actual field values to update - it cannot be empty. Supports complex field types like timestamps and document references using special syntax. To update more than one document, use update_documents instead.\n\nIMPORTANT: document_data must contain real field names and values to update. Do not send empty objects.\n\nUsage Examples:\n- Update user email: document_path='users/123', document_data={email:'newemail@example.com', updated_at:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}}\n- Update with reference: document_path='orders/456', document_data={status:'shipped', shipped_at:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}, tracking_number:'TRK123'}\n- Simple update: document_path='products/789', document_data={price:39.99, in_stock:false, last_updated:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}}\n- Update multiple fields: document_path='users/456', document_data={name:'Jane Smith', age:31, active:true, profile:{bio:'Updated bio', location:'New York'}}",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_path": {
+                    "type": "string",
+                    "description": "Full path to the document to update. Examples: 'users/123', 'orders/456', 'products/789'",
+                },
+                "document_data": {
+                    "type": "object",
+                    "additionalProperties": True,
+                    "description": "REQUIRED: The document data to update. Must contain actual field names and values (cannot be empty). For complex types, use {_type: 'timestamp', _value: 'ISO_string'} for timestamps and {_type: 'reference', _value: 'path/to/doc'} for references. Example: {email:'new@example.com', age:31, updated_at:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}}",
+                },
+                "database": {
+                    "type": "string",
+                    "description": "Database id to use. Defaults to `(default)` if unspecified.",
+                },
+                "use_emulator": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Target the Firestore emulator if true.",
+                },
+            },
+            "required": ["document_path", "document_data"],
+        },
+    ),
+    Tool(
+        name="create_documents",
+        description="Create many documents in a Firestore collection at once. Writes are grouped into batches of up to 500 and committed in parallel, which is much faster than calling create_document repeatedly. Supports the same complex field types as create_document.\n\nUsage Examples:\n- Import products: collection_path='products', documents=[{document_data:{name:'Widget', price:29.99}}, {document_id:'gadget', document_data:{name:'Gadget', price:49.99}}]",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection_path": {
+                    "type": "string",
+                    "description": "The collection path where the documents will be created. Examples: 'users', 'orders', 'products'",
+                },
+                "documents": {
+                    "type": "array",
+                    "description": "Documents to create. Each item needs non-empty document_data and may set a custom document_id.",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "document_id": {
+                                "type": "string",
+                                "description": "Optional custom document ID. If not provided, Firestore will auto-generate one.",
+                            },
+                            "document_data": {
+                                "type": "object",
+                                "additionalProperties": True,
+                                "description": "REQUIRED: The document data to create, using the same format as create_document.",
+                            },
+                        },
+                        "required": ["document_data"],
+                    },
+                },
+                "database": {
+                    "type": "string",
+                    "description": "Database id to use. Defaults to `(default)` if unspecified.",
+                },
+                "use_emulator": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Target the Firestore emulator if true.",
+                },
+            },
+            "required": ["collection_path", "documents"],
+        },
+    ),
+    Tool(
+        name="update_documents",
+        description="Update many existing Firestore documents at once. Writes are grouped into batches of up to 500 and committed in parallel, which is much faster than calling update_document repeatedly. Supports the same complex field types as update_document.\n\nUsage Examples:\n- Mark orders shipped: updates=[{document_path:'orders/1', document_data:{status:'shipped'}}, {document_path:'orders/2', document_data:{status:'shipped'}}]",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "updates": {
+                    "type": "array",
+                    "description": "Updates to apply. Each item needs a document_path and non-empty document_data.",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "document_path": {
+                                "type": "string",
+                                "description": "Full path to the document to update. Examples: 'users/123', 'orders/456'",
+                            },
+                            "document_data": {
+                                "type": "object",
+                                "additionalProperties": True,
+                                "description": "REQUIRED: The fields to update, using the same format as update_document.",
+                            },
+                        },
+                        "required": ["document_path", "document_data"],
+                    },
+                },
+                "database": {
+                    "type": "string",
+                    "description": "Database id to use. Defaults to `(default)` if unspecified.",
+                },
+                "use_emulator": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Target the Firestore emulator if true.",
+                },
+            },
+            "required": ["updates"],
+        },
+    ),
+]
+
+
+# Documents returned per read_resource call; further pages are linked by cursor
+RESOURCE_PAGE_SIZE = 10
+
+
 def create_server(user_id, api_key=None):
     """Create a new server instance with optional user context"""
     server = Server("firestore-server")
@@ -323,18 +941,20 @@ def create_server(user_id, api_key=None):
 
         try:
             client = await create_firestore_client(server.user_id, server.api_key)
-            collections = client.collections()
+            collections = [collection async for collection in client.collections()]
 
             # List collections
             resources = []
 
             for collection in collections:
-                resource = Resource(
-                    uri=f"firestore://{collection.id}",
-                    name=f"Collection: {collection.id}",
-                    description=f"Firestore collection: {collection.id}",
+                collection_id = collection.id
+                resources.append(
+                    Resource(
+                        uri="firestore://" + collection_id,
+                        name="Collection: " + collection_id,
+                        description="Firestore collection: " + collection_id,
+                    )
                 )
-                resources.append(resource)
 
             logger.info(f"Total collections found: {len(resources)}")
             return resources
@@ -354,28 +974,40 @@ def create_server(user_id, api_key=None):
         try:
             client = await create_firestore_client(server.user_id, server.api_key)
 
-            # Extract collection path from URI
-            collection_path = uri_str.replace("firestore://", "")
-
-            # Query the collection
-            docs = client.collection(collection_path).limit(10).stream()
+            # Extract collection path and optional page cursor from URI
+            resource = uri_str.replace("firestore://", "")
+            collection_path, _, query_string = resource.partition("?")
+            cursor = parse_qs(query_string).get("cursor", [None])[0]
 
-            # Convert documents to JSON
-            documents = []
-            for doc in docs:
-                doc_data = doc.to_dict()
-                doc_data["_id"] = doc.id
-                # Convert any DocumentReference objects to strings
-                doc_data = convert_firestore_to_serializable(doc_data)
-                documents.append(doc_data)
+            # Query one page of the collection, resuming after the cursor doc
+            collection_ref = client.collection(collection_path)
+            query = collection_ref.limit(RESOURCE_PAGE_SIZE)
+            if cursor:
+                cursor_doc = await collection_ref.document(cursor).get()
+                if not cursor_doc.exists:
+                    raise ValueError(f"Invalid cursor: {cursor}")
+                query = query.start_after(cursor_doc)
+            documents = [document_with_id(doc) async for doc in query.stream()]
 
-            formatted_data = json.dumps(documents, indent=2)
+            formatted_data = to_json(documents)
 
-            return [
+            contents = [
                 ReadResourceContents(
                     content=formatted_data, mime_type="application/json"
                 )
             ]
+
+            # A full page may have more documents after it; link the next page
+            if len(documents) == RESOURCE_PAGE_SIZE:
+                next_cursor = quote(documents[-1]["_id"])
+                contents.append(
+                    ReadResourceContents(
+                        content=f"firestore://{collection_path}?cursor={next_cursor}",
+                        mime_type="text/uri-list",
+                    )
+                )
+
+            return contents
         except Exception as e:
             logger.error(f"Failed to read resource: {str(e)}")
             return [
@@ -388,232 +1020,7 @@ def create_server(user_id, api_key=None):
     async def handle_list_tools() -> list[Tool]:
         """List available tools"""
         logger.info(f"Listing tools for user: {server.user_id}")
-        return [
-            Tool(
-                name="query_collection",
-                description="Query a Firestore collection with advanced filtering, ordering, and pagination. Use this to search for documents that match specific criteria, sort results, and limit the number of returned documents. Perfect for finding specific data within a collection.\n\nUsage Examples:\n- Find all users with status 'active': collection_path='users', filters=[{field:'status', op:'EQUAL', compare_value:{string_value:'active'}}]\n- Get recent orders: collection_path='orders', order={orderBy:'created_at', orderByDirection:'DESCENDING'}, limit=20\n- Search by email: collection_path='users', filters=[{field:'email', op:'EQUAL', compare_value:{string_value:'user@example.com'}}]\n- Filter by timestamp (using date_value): collection_path='orders', filters=[{field:'created_at', op:'GREATER_THAN', compare_value:{date_value:'2023-10-23T00:00:00Z'}}]\n- Get orders from last week: collection_path='orders', filters=[{field:'created_at', op:'GREATER_THAN_OR_EQUAL', compare_value:{date_value:'2023-10-16T00:00:00Z'}}]\n- Return only selected fields: collection_path='companies/tenant/accounts', select_fields='code,name,accountName'",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "database": {
-                            "type": "string",
-                            "description": "Database id to use. Defaults to `(default)` if unspecified.",
-                        },
-                        "collection_path": {
-                            "type": "string",
-                            "description": "The collection path to query. Examples: 'users', 'companies', 'orders', 'users/123/orders' (for subcollections)",
-                        },
-                        "filters": {
-                            "type": "array",
-                            "description": "Array of filter conditions to apply to the query. Each filter specifies a field, operator, and value to match against. For timestamp fields, use ISO 8601 format (e.g., '2023-10-23T19:30:16.740Z') or RFC3339 format.",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "compare_value": {
-                                        "type": "object",
-                                        "description": "One and only one value may be specified per filters object.",
-                                        "properties": {
-                                            "string_value": {
-                                                "type": "string",
-                                                "description": "The string value to compare against. For timestamp fields, use ISO 8601 format (e.g., '2023-10-23T19:30:16.740Z').",
-                                            },
-                                            "boolean_value": {
-                                                "type": "string",
-                                                "description": "The boolean value to compare against.",
-                                            },
-                                            "string_array_value": {
-                                                "type": "array",
-                                                "items": {"type": "string"},
-                                                "description": "The string value to compare against.",
-                                            },
-                                            "integer_value": {
-                                                "type": "number",
-                                                "description": "The integer value to compare against.",
-                                            },
-                                            "double_value": {
-                                                "type": "number",
-                                                "description": "The double value to compare against.",
-                                            },
-                                            "date_value": {
-                                                "type": "string",
-                                                "description": "The date/timestamp value to compare against. Use ISO 8601 format (e.g., '2023-10-23T19:30:16.740Z'). This will be automatically converted to a datetime object.",
-                                            },
-                                        },
-                                    },
-                                    "field": {
-                                        "type": "string",
-                                        "description": "The document field to filter against (e.g., 'name', 'email', 'created_at', 'updated_at'). For timestamp fields, use ISO 8601 format in compare_value.",
-                                    },
-                                    "op": {
-                                        "type": "string",
-                                        "enum": [
-                                            "OPERATOR_UNSPECIFIED",
-                                            "LESS_THAN",
-                                            "LESS_THAN_OR_EQUAL",
-                                            "GREATER_THAN",
-                                            "GREATER_THAN_OR_EQUAL",
-                                            "EQUAL",
-                                            "NOT_EQUAL",
-                                            "ARRAY_CONTAINS",
-                                            "ARRAY_CONTAINS_ANY",
-                                            "IN",
-                                            "NOT_IN",
-                                        ],
-                                        "description": "The comparison operator to use (EQUAL, NOT_EQUAL, GREATER_THAN, LESS_THAN, etc.). For timestamp fields, use GREATER_THAN, LESS_THAN, GREATER_THAN_OR_EQUAL, LESS_THAN_OR_EQUAL for date ranges.",
-                                    },
-                                },
-                                "required": ["compare_value", "field", "op"],
-                            },
-                        },
-                    },
-                    "order": {
-                        "type": "object",
-                        "description": "Optional sorting configuration. Specifies which field to sort by and the direction (ascending/descending).",
-                        "properties": {
-                            "orderBy": {
-                                "type": "string",
-                                "description": "The field name to sort by (e.g., 'created_at', 'name', 'price')",
-                            },
-                            "orderByDirection": {
-                                "type": "string",
-                                "enum": ["ASCENDING", "DESCENDING"],
-                                "description": "Sort direction: ASCENDING (A-Z, 1-9) or DESCENDING (Z-A, 9-1)",
-                            },
-                        },
-                        "required": ["orderBy", "orderByDirection"],
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of documents to return (default: 10, max recommended: 100 for performance)",
-                    },
-                    "select_fields": {
-                        "type": "string",
-                        "description": "Optional comma-separated list of document field paths to return (e.g. 'code,name,accountName,sourceData.code'). When set, Firestore returns only these fields plus the document id as `_id`. Omit to return full documents.",
-                    },
-                    "use_emulator": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "Target the Firestore emulator if true.",
-                    },
-                    "required": ["collection_path"],
-                },
-                # outputSchema={
-                #     "type": "array",
-                #     "items": {"type": "object"},
-                #     "description": "Array of Firestore documents matching the query",
-                # },
-            ),
-            Tool(
-                name="get_document",
-                description="Retrieve a specific Firestore document by its full path. Use this when you know the exact document ID and want to fetch a single document's data. Perfect for getting detailed information about a specific record.\n\nUsage Examples:\n- Get user profile: document_path='users/123'\n- Get company details: document_path='companies/abc-456'\n- Get order information: document_path='orders/order-789'",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "document_path": {
-                            "type": "string",
-                            "description": "Full path to the document. Examples: 'users/123', 'companies/abc-456', 'orders/order-789'",
-                        },
-                        "database": {
-                            "type": "string",
-                            "description": "Database id to use. Defaults to `(default)` if unspecified.",
-                        },
-                        "use_emulator": {
-                            "type": "boolean",
-                            "default": False,
-                            "description": "Target the Firestore emulator if true.",
-                        },
-                    },
-                    "required": ["document_path"],
-                },
-                # outputSchema={
-                #     "type": "object",
-                #     "description": "Firestore document data",
-                # },
-            ),
-            Tool(
-                name="list_collections",
-                description="List all top-level collections in the Firestore database. Use this to discover what collections are available before querying or to get an overview of your database structure. Returns collection names only.\n\nUsage Examples:\n- Discover available collections: No parameters needed\n- Get database overview: Use before querying to see what data is available\n- Check if a collection exists: Look for specific collection names in the results",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "database": {
-                            "type": "string",
-                            "description": "Database id to use. Defaults to `(default)` if unspecified.",
-                        },
-                        "use_emulator": {
-                            "type": "boolean",
-                            "default": False,
-                            "description": "Target the Firestore emulator if true.",
-                        },
-                    },
-                },
-                # outputSchema={
-                #     "type": "array",
-                #     "items": {"type": "string"},
-                #     "description": "Array of collection names",
-                # },
-            ),
-            Tool(
-                name="create_document",
-                description="Create a new document in a Firestore collection. Use this to add new records to your database. The document_data must contain actual field values - it cannot be empty. Supports complex field types like timestamps and document references using special syntax.\n\nIMPORTANT: document_data must contain real data with field names and values. Do not send empty objects.\n\nUsage Examples:\n- Create a user: collection_path='users', document_data={name:'John Doe', email:'john@example.com', created_at:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}}\n- Create with reference: collection_path='orders', document_data={user_id:{_type:'reference', _value:'users/123'}, amount:99.99, status:'pending'}\n- Simple document: collection_path='products', document_data={name:'Widget', price:29.99, active:true, category:'electronics'}\n- With nested data: collection_path='profiles', document_data={user:{name:'Jane', age:30}, settings:{theme:'dark', notifications:true}}",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "collection_path": {
-                            "type": "string",
-                            "description": "The collection path where the document will be created. Examples: 'users', 'orders', 'products'",
-                        },
-                        "document_data": {
-                            "type": "object",
-                            "additionalProperties": True,
-                            "description": "REQUIRED: The document data to create. Must contain actual field names and values (cannot be empty). For complex types, use {_type: 'timestamp', _value: 'ISO_string'} for timestamps and {_type: 'reference', _value: 'path/to/doc'} for references. Example: {name:'John', age:30, created_at:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}}",
-                        },
-                        "document_id": {
-                            "type": "string",
-                            "description": "Optional custom document ID. If not provided, Firestore will auto-generate one.",
-                        },
-                        "database": {
-                            "type": "string",
-                            "description": "Database id to use. Defaults to `(default)` if unspecified.",
-                        },
-                        "use_emulator": {
-                            "type": "boolean",
-                            "default": False,
-                            "description": "Target the Firestore emulator if true.",
-                        },
-                    },
-                    "required": ["collection_path", "document_data"],
-                },
-            ),
-            Tool(
-                name="update_document",
-                description="Update an existing document in Firestore. Use this to modify existing records. The document_data must contain actual field values to update - it cannot be empty. Supports complex field types like timestamps and document references using special syntax.\n\nIMPORTANT: document_data must contain real field names and values to update. Do not send empty objects.\n\nUsage Examples:\n- Update user email: document_path='users/123', document_data={email:'newemail@example.com', updated_at:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}}\n- Update with reference: document_path='orders/456', document_data={status:'shipped', shipped_at:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}, tracking_number:'TRK123'}\n- Simple update: document_path='products/789', document_data={price:39.99, in_stock:false, last_updated:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}}\n- Update multiple fields: document_path='users/456', document_data={name:'Jane Smith', age:31, active:true, profile:{bio:'Updated bio', location:'New York'}}",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "document_path": {
-                            "type": "string",
-                            "description": "Full path to the document to update. Examples: 'users/123', 'orders/456', 'products/789'",
-                        },
-                        "document_data": {
-                            "type": "object",
-                            "additionalProperties": True,
-                            "description": "REQUIRED: The document data to update. Must contain actual field names and values (cannot be empty). For complex types, use {_type: 'timestamp', _value: 'ISO_string'} for timestamps and {_type: 'reference', _value: 'path/to/doc'} for references. Example: {email:'new@example.com', age:31, updated_at:{_type:'timestamp', _value:'2023-10-23T19:30:16Z'}}",
-                        },
-                        "database": {
-                            "type": "string",
-                            "description": "Database id to use. Defaults to `(default)` if unspecified.",
-                        },
-                        "use_emulator": {
-                            "type": "boolean",
-                            "default": False,
-                            "description": "Target the Firestore emulator if true.",
-                        },
-                    },
-                    "required": ["document_path", "document_data"],
-                },
-            ),
-        ]
+        return TOOLS
 
     @server.call_tool()
     async def handle_call_tool(
@@ -652,89 +1059,34 @@ def create_server(user_id, api_key=None):
                     op = filter_item.get("op")
                     compare_value = filter_item.get("compare_value", {})
 
-                    # Find the non-null value
-                    value = None
-                    for key, val in compare_value.items():
-                        if val is not None:
-                            value = val
-                            break
+                    value_key, value = _filter_value(compare_value)
+                    operator = _FILTER_OPERATORS.get(op)
 
-                    if value is not None:
-                        # Convert string timestamps to Firestore Timestamp objects
+                    if value is not None and operator is not None:
                         processed_value = value
 
-                        # Check if this is a date_value (explicit timestamp field)
-                        is_date_value = (
-                            "date_value" in compare_value
-                            and compare_value["date_value"] is not None
-                        )
-
-                        if isinstance(value, str) and (
-                            is_date_value
-                            or any(
-                                timestamp_indicator in field.lower()
-                                for timestamp_indicator in [
-                                    "_at",
-                                    "time",
-                                    "date",
-                                    "created",
-                                    "updated",
-                                    "modified",
-                                ]
-                            )
+                        # Explicit coercions per value key; string values on
+                        # timestamp-like fields are parsed as datetimes too
+                        coerce = _FILTER_VALUE_COERCERS.get(value_key)
+                        if (
+                            coerce is None
+                            and _looks_like_iso(value)
+                            and _TIMESTAMP_FIELD_RE.search(field) is not None
                         ):
+                            coerce = _parse_iso
+
+                        if coerce is not None:
                             try:
-                                from datetime import datetime
-
-                                # Try to parse ISO 8601 format
-                                if "T" in value and (
-                                    "Z" in value or "+" in value or "-" in value[-6:]
-                                ):
-                                    dt = datetime.fromisoformat(
-                                        value.replace("Z", "+00:00")
-                                    )
-                                    processed_value = dt
-                                    logger.info(
-                                        f"Converted {'date_value' if is_date_value else 'timestamp string'} '{value}' to datetime object for field '{field}'"
-                                    )
-                                else:
-                                    # Try to parse as regular datetime
-                                    dt = datetime.fromisoformat(value)
-                                    processed_value = dt
-                                    logger.info(
-                                        f"Converted {'date_value' if is_date_value else 'datetime string'} '{value}' to datetime object for field '{field}'"
-                                    )
-                            except (ValueError, TypeError) as e:
+                                processed_value = coerce(value)
+                                logger.info(
+                                    f"Converted {value_key} '{value}' to {type(processed_value).__name__} for field '{field}'"
+                                )
+                            except (ValueError, TypeError, AttributeError) as e:
                                 logger.warning(
-                                    f"Failed to convert {'date_value' if is_date_value else 'timestamp string'} '{value}' for field '{field}': {e}. Using as string."
+                                    f"Failed to convert {value_key} '{value}' for field '{field}': {e}. Using as is."
                                 )
-                                processed_value = value
-
-                        # Map Firestore operators
-                        if op == "EQUAL":
-                            query = query.where(field, "==", processed_value)
-                        elif op == "NOT_EQUAL":
-                            query = query.where(field, "!=", processed_value)
-                        elif op == "LESS_THAN":
-                            query = query.where(field, "<", processed_value)
-                        elif op == "LESS_THAN_OR_EQUAL":
-                            query = query.where(field, "<=", processed_value)
-                        elif op == "GREATER_THAN":
-                            query = query.where(field, ">", processed_value)
-                        elif op == "GREATER_THAN_OR_EQUAL":
-                            query = query.where(field, ">=", processed_value)
-                        elif op == "ARRAY_CONTAINS":
-                            query = query.where(
-                                field, "array_contains", processed_value
-                            )
-                        elif op == "ARRAY_CONTAINS_ANY":
-                            query = query.where(
-                                field, "array_contains_any", processed_value
-                            )
-                        elif op == "IN":
-                            query = query.where(field, "in", processed_value)
-                        elif op == "NOT_IN":
-                            query = query.where(field, "not_in", processed_value)
+
+                        query = query.where(field, operator, processed_value)
 
                 # Apply ordering
                 if order:
@@ -755,27 +1107,17 @@ def create_server(user_id, api_key=None):
                 # Apply limit
                 query = query.limit(limit)
 
-                # Execute query
-                docs = query.stream()
-
-                # Convert to JSON
-                documents = []
-                for doc in docs:
-                    doc_data = doc.to_dict()
-                    doc_data["_id"] = doc.id
-                    # Convert any DocumentReference objects to strings
-                    doc_data = convert_firestore_to_serializable(doc_data)
-                    documents.append(doc_data)
-
+                # Execute query, serializing documents as they stream in
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(documents, indent=2),
+                        text=await stream_documents_to_json(query.stream()),
                     )
                 ]
 
             elif name == "get_document":
                 document_path = arguments.get("document_path")
+                select_fields = parse_select_fields(arguments.get("select_fields"))
                 database = arguments.get("database", "(default)")
 
                 if not document_path:
@@ -787,38 +1129,77 @@ def create_server(user_id, api_key=None):
 
                 # Get the document
                 doc_ref = client.document(document_path)
-                doc = doc_ref.get()
+                doc = await doc_ref.get(field_paths=select_fields or None)
 
                 if doc.exists:
-                    doc_data = doc.to_dict()
-                    doc_data["_id"] = doc.id
-                    # Convert any DocumentReference objects to strings
-                    doc_data = convert_firestore_to_serializable(doc_data)
                     return [
                         TextContent(
                             type="text",
-                            text=json.dumps(doc_data, indent=2),
+                            text=to_json(document_with_id(doc)),
                         )
                     ]
                 else:
                     return [
                         TextContent(
                             type="text",
-                            text=json.dumps({"error": "Document not found"}, indent=2),
+                            text=to_json({"error": "Document not found"}),
                         )
                     ]
 
+            elif name == "get_documents":
+                document_paths = arguments.get("document_paths") or []
+                select_fields = parse_select_fields(arguments.get("select_fields"))
+                database = arguments.get("database", "(default)")
+
+                if not document_paths:
+                    raise ValueError("Must supply at least one document path.")
+
+                # Remove leading slashes if present
+                document_paths = [
+                    path[1:] if path.startswith("/") else path
+                    for path in document_paths
+                ]
+
+                # Fetch all documents in one batched RPC instead of one per path
+                refs = [client.document(path) for path in document_paths]
+                snapshots = {
+                    doc.reference.path: doc
+                    async for doc in client.get_all(
+                        refs, field_paths=select_fields or None
+                    )
+                }
+
+                documents = []
+                for ref in refs:
+                    doc = snapshots.get(ref.path)
+                    if doc is not None and doc.exists:
+                        documents.append(document_with_id(doc))
+                    else:
+                        documents.append(
+                            {
+                                "_id": ref.id,
+                                "path": ref.path,
+                                "error": "Document not found",
+                            }
+                        )
+
+                return [
+                    TextContent(
+                        type="text",
+                        text=to_json(documents),
+                    )
+                ]
+
             elif name == "list_collections":
                 database = arguments.get("database", "(default)")
 
                 # List collections
-                collections = client.collections()
-                collection_names = [col.id for col in collections]
+                collection_names = [col.id async for col in client.collections()]
 
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(collection_names, indent=2),
+                        text=to_json(collection_names),
                     )
                 ]
 
@@ -841,20 +1222,19 @@ def create_server(user_id, api_key=None):
                 # Create the document
                 if document_id:
                     doc_ref = client.collection(collection_path).document(document_id)
-                    doc_ref.set(processed_data)
+                    await doc_ref.set(processed_data)
                     result = {"id": document_id, "path": doc_ref.path, "created": True}
                 else:
-                    doc_ref = client.collection(collection_path).add(processed_data)
-                    result = {
-                        "id": doc_ref[1].id,
-                        "path": doc_ref[1].path,
-                        "created": True,
-                    }
+                    # add() returns an (update_time, document_reference) pair
+                    _, doc_ref = await client.collection(collection_path).add(
+                        processed_data
+                    )
+                    result = {"id": doc_ref.id, "path": doc_ref.path, "created": True}
 
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(result, indent=2),
+                        text=to_json(result),
                     )
                 ]
 
@@ -879,14 +1259,111 @@ def create_server(user_id, api_key=None):
 
                 # Update the document
                 doc_ref = client.document(document_path)
-                doc_ref.update(processed_data)
+                await doc_ref.update(processed_data)
 
                 result = {"id": doc_ref.id, "path": doc_ref.path, "updated": True}
 
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(result, indent=2),
+                        text=to_json(result),
+                    )
+                ]
+
+            elif name == "create_documents":
+                collection_path = arguments.get("collection_path")
+                documents = arguments.get("documents") or []
+
+                if not collection_path:
+                    raise ValueError("Must supply collection path.")
+
+                if not documents:
+                    raise ValueError("Must supply at least one document to create.")
+
+                collection_ref = client.collection(collection_path)
+                writes = []
+                for document in documents:
+                    document_data = document.get("document_data")
+                    if not document_data:
+                        raise ValueError(
+                            "document_data cannot be empty. You must provide actual field names and values for every document."
+                        )
+                    document_id = document.get("document_id")
+                    # document() without an id allocates an auto-generated one
+                    doc_ref = (
+                        collection_ref.document(document_id)
+                        if document_id
+                        else collection_ref.document()
+                    )
+                    writes.append(
+                        ("set", doc_ref, process_document_data(document_data, client))
+                    )
+
+                errors = await commit_writes_in_batches(client, writes)
+
+                results = []
+                for (_, doc_ref, _), error in zip(writes, errors):
+                    result = {"id": doc_ref.id, "path": doc_ref.path}
+                    if error:
+                        result["created"] = False
+                        result["error"] = error
+                    else:
+                        result["created"] = True
+                    results.append(result)
+
+                return [
+                    TextContent(
+                        type="text",
+                        text=to_json(results),
+                    )
+                ]
+
+            elif name == "update_documents":
+                updates = arguments.get("updates") or []
+
+                if not updates:
+                    raise ValueError("Must supply at least one document update.")
+
+                writes = []
+                for update in updates:
+                    document_path = update.get("document_path")
+                    document_data = update.get("document_data")
+                    if not document_path:
+                        raise ValueError("Must supply document path for every update.")
+                    if not document_data:
+                        raise ValueError(
+                            "document_data cannot be empty. You must provide actual field names and values for every update."
+                        )
+
+                    # Remove leading slash if present
+                    if document_path.startswith("/"):
+                        document_path = document_path[1:]
+
+                    doc_ref = client.document(document_path)
+                    writes.append(
+                        (
+                            "update",
+                            doc_ref,
+                            process_document_data(document_data, client),
+                        )
+                    )
+
+                errors = await commit_writes_in_batches(client, writes)
+
+                results = []
+                for (_, doc_ref, _), error in zip(writes, errors):
+                    result = {"id": doc_ref.id, "path": doc_ref.path}
+                    if error:
+                        result["updated"] = False
+                        result["error"] = error
+                    else:
+                        result["updated"] = True
+                    results.append(result)
+
+                return [
+                    TextContent(
+                        type="text",
+                        text=to_json(results),
                     )
                 ]
 
@@ -898,7 +1375,7 @@ def create_server(user_id, api_key=None):
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps({"error": str(e)}, indent=2),
+                    text=to_json({"error": str(e)}),
                 )
             ]
 
@@ -1,10 +1,31 @@
+import asyncio
+import functools
+import io
 import json
 import os
+import random
+import re
 import sys
-from typing import Optional, Iterable
-from base64 import urlsafe_b64encode, urlsafe_b64decode
-import base64
-import mimetypes
+import threading
+import time
+import weakref
+from datetime import timezone
+from typing import Dict, Optional, Iterable
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import charset_normalizer
+except ImportError:  # charset detection is skipped without it
+    charset_normalizer = None
+
+try:
+    from pybase64 import b64decode, urlsafe_b64decode
+except ImportError:  # pybase64 is an optional SIMD speedup
+    from base64 import b64decode, urlsafe_b64decode
 
 # Add both project root and src directory to Python path
 # Get the project root directory and add to path
@@ -32,13 +53,14 @@ from mcp.server.models import InitializationOptions
 from src.utils.google.util import authenticate_and_save_credentials, get_credentials
 from src.utils.storage.factory import get_storage_service
 
-from googleapiclient.discovery import build
+import httplib2
+from cachetools import TTLCache
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import MediaIoBaseUpload
+from googleapiclient.model import JsonModel
 import html as html_lib
-import email.utils
-import email.mime.text
-import email.mime.multipart
-import email.mime.base
-import email.encoders
 import email.policy
 from email.message import EmailMessage
 
@@ -57,84 +79,577 @@ logging.basicConfig(
 logger = logging.getLogger(SERVICE_NAME)
 
 
-def parse_email_body(payload):
-    """Extract email body from Gmail API payload"""
-    body = {"text": "", "html": ""}
+def to_json(data) -> str:
+    """Serialize a response payload as compact JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"))
 
-    if "parts" in payload:
-        # Multipart message
-        for part in payload["parts"]:
-            mime_type = part.get("mimeType", "")
 
-            if mime_type == "text/plain":
-                if "data" in part.get("body", {}):
-                    body["text"] = urlsafe_b64decode(part["body"]["data"]).decode(
-                        "utf-8", errors="replace"
-                    )
-            elif mime_type == "text/html":
-                if "data" in part.get("body", {}):
-                    body["html"] = urlsafe_b64decode(part["body"]["data"]).decode(
-                        "utf-8", errors="replace"
-                    )
-            elif mime_type.startswith("multipart/"):
-                # Recursively parse nested multipart
-                nested_body = parse_email_body(part)
-                if nested_body["text"]:
-                    body["text"] = nested_body["text"]
-                if nested_body["html"]:
-                    body["html"] = nested_body["html"]
-    else:
-        # Single part message
-        if "body" in payload and "data" in payload["body"]:
-            mime_type = payload.get("mimeType", "")
-            data = urlsafe_b64decode(payload["body"]["data"]).decode(
-                "utf-8", errors="replace"
-            )
-            if mime_type == "text/plain":
-                body["text"] = data
-            elif mime_type == "text/html":
-                body["html"] = data
-
-    return body
-
-
-def get_attachments_info(payload):
-    """Extract attachment information from Gmail API payload"""
-    attachments = []
-
-    if "parts" in payload:
-        for part in payload["parts"]:
-            if part.get("filename"):
-                attachment_info = {
-                    "filename": part["filename"],
-                    "mimeType": part.get("mimeType", "application/octet-stream"),
-                    "size": part["body"].get("size", 0),
-                    "attachmentId": part["body"].get("attachmentId"),
+# Headers shown in email summaries
+SUMMARY_HEADERS = frozenset({"Subject", "From", "Date"})
+STRUCTURED_HEADERS = frozenset(
+    {"From", "To", "Cc", "Bcc", "Subject", "Date", "Message-ID"}
+)
+
+
+def extract_headers(msg, wanted=None):
+    """Map header names to values for a Gmail API message
+
+    Args:
+        msg: Message resource returned by the Gmail API
+        wanted: Set of header names to keep; all headers are kept when omitted
+
+    Returns:
+        Dict of header name to value
+    """
+    headers = msg.get("payload", {}).get("headers", [])
+    if wanted is None:
+        return {header["name"]: header["value"] for header in headers}
+
+    # Stop once every wanted header is found, since long recipient lists can
+    # make the header list large
+    found = {}
+    for header in headers:
+        name = header["name"]
+        if name in wanted and name not in found:
+            found[name] = header["value"]
+            if len(found) == len(wanted):
+                break
+    return found
+
+
+# Parts nested deeper than this are ignored so crafted messages stay cheap
+MAX_MIME_DEPTH = 32
+
+
+# Body kinds by MIME type, in the order callers prefer them
+BODY_KINDS = {"text/plain": "text", "text/html": "html"}
+
+
+def _walk_payload(payload, bodies, attachments, stop_kind=None):
+    """
+    Collect body parts and attachment info from a payload, depth first
+
+    attachments is None when attachment info is not needed. The walk ends at the
+    first body part of stop_kind, if given.
+    """
+    # Children are pushed in reverse so parts are visited in message order
+    stack = [(payload, 0)]
+    while stack:
+        part, depth = stack.pop()
+        filename = part.get("filename")
+        mime_type = part.get("mimeType", "")
+        if filename:
+            if attachments is None:
+                continue
+            part_body = part.get("body", {})
+            attachments.append(
+                {
+                    "filename": filename,
+                    "mimeType": mime_type or "application/octet-stream",
+                    "size": part_body.get("size", 0),
+                    "attachmentId": part_body.get("attachmentId"),
                 }
-                attachments.append(attachment_info)
-            # Check for nested parts
-            elif "parts" in part:
-                nested_attachments = get_attachments_info(part)
-                attachments.extend(nested_attachments)
+            )
+        elif mime_type in BODY_KINDS:
+            if part.get("body", {}).get("data"):
+                kind = BODY_KINDS[mime_type]
+                bodies[kind] = part
+                if kind == stop_kind:
+                    return
+        elif "parts" in part and depth < MAX_MIME_DEPTH:
+            stack.extend((child, depth + 1) for child in reversed(part["parts"]))
+
+
+def walk_payload(
+    payload, want=("text", "html"), first_only=False, with_attachments=True
+):
+    """Extract body and attachment information from a Gmail API payload in one pass
+
+    Bodies are only base64-decoded once the walk is done, and only for the kinds
+    the caller will show. With first_only and no attachments wanted, the walk
+    stops at the first part of the preferred kind.
+
+    Args:
+        payload: The "payload" of a message fetched with format="full"
+        want: Body kinds to decode, in order of preference
+        first_only: Decode only the first kind in want that the message has
+        with_attachments: Whether to collect attachment info
+
+    Returns:
+        Dict with "text" and "html" bodies and a list of "attachments"
+    """
+    bodies = {}
+    attachments = [] if with_attachments else None
+    stop_kind = want[0] if first_only and want and not with_attachments else None
+    _walk_payload(payload, bodies, attachments, stop_kind)
 
-    return attachments
+    content = {"text": "", "html": "", "attachments": attachments or []}
+    for kind in want:
+        part = bodies.get(kind)
+        if part is not None:
+            content[kind] = decode_body(part)
+            if first_only:
+                break
+    return content
 
 
-def download_attachment(gmail_service, user_id, message_id, attachment_id):
-    """Download attachment data from Gmail"""
+_CHARSET_RE = re.compile(r'charset="?([^";\s]+)', re.IGNORECASE)
+
+
+def _declared_charset(part):
+    """Charset from a part's Content-Type header, if one is declared"""
+    for header in part.get("headers", []):
+        if header["name"].lower() == "content-type":
+            match = _CHARSET_RE.search(header["value"])
+            return match.group(1) if match else None
+    return None
+
+
+def decode_body(part):
+    """
+    Decode the text of a body part
+
+    UTF-8 is tried strictly first, since most mail uses it. Other text is
+    decoded with the charset declared in the part's Content-Type header, or one
+    detected by charset_normalizer when none is declared.
+
+    Args:
+        part: Payload part holding base64url body data
+
+    Returns:
+        The decoded text
+    """
+    raw = urlsafe_b64decode(part["body"]["data"])
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+
+    charset = _declared_charset(part)
+    if charset is None and charset_normalizer is not None:
+        best = charset_normalizer.from_bytes(raw).best()
+        charset = best.encoding if best is not None else None
     try:
-        attachment = (
+        return raw.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        logger.warning(f"Unknown charset {charset}, decoding body as UTF-8")
+        return raw.decode("utf-8", errors="replace")
+
+
+# Attachments never change, so downloads are kept for a while to serve repeat
+# forwards and get_attachment calls; the cache is bounded by total bytes
+ATTACHMENT_CACHE_TTL = 300.0  # seconds
+ATTACHMENT_CACHE_BYTES = 64 * 1024 * 1024
+_attachment_cache = TTLCache(
+    maxsize=ATTACHMENT_CACHE_BYTES, ttl=ATTACHMENT_CACHE_TTL, getsizeof=len
+)
+
+# Attachment MIME types by filename per message, remembered from read_emails so
+# get_attachment calls without mime_type don't refetch the message structure
+_attachment_types_cache = TTLCache(maxsize=4096, ttl=ATTACHMENT_CACHE_TTL)
+
+
+def _remember_attachment_types(mailbox, message_id, attachments):
+    """Cache the MIME types of a message's attachments by filename"""
+    if attachments:
+        _attachment_types_cache[(mailbox, message_id)] = {
+            att["filename"]: att["mimeType"] for att in attachments
+        }
+
+
+# Signed attachment URLs are handed out again while they have at least
+# DOWNLOAD_URL_MIN_REMAINING seconds left, skipping both Gmail and storage
+DOWNLOAD_URL_TTL = 3600  # seconds
+DOWNLOAD_URL_MIN_REMAINING = 600  # seconds
+_download_url_cache = TTLCache(
+    maxsize=1024, ttl=DOWNLOAD_URL_TTL - DOWNLOAD_URL_MIN_REMAINING
+)
+
+# Per-mailbox map of label names and ids to label ids. Only this stable
+# metadata is cached; message counts change with every new mail.
+LABEL_CACHE_TTL = 300.0  # seconds
+_label_ids_cache = TTLCache(maxsize=1024, ttl=LABEL_CACHE_TTL)
+
+
+def _cache_label_ids(mailbox, labels):
+    """Cache the label id lookup for a mailbox from a labels().list response"""
+    label_ids = {}
+    for label in labels:
+        label_ids[label["name"]] = label["id"]
+        label_ids[label["id"]] = label["id"]
+    _label_ids_cache[mailbox] = label_ids
+
+
+async def resolve_label_ids(gmail_service, mailbox, labels):
+    """
+    Map label names to Gmail label ids
+
+    The mailbox's labels are listed once and cached, so repeated label updates
+    don't each cost a labels().list call.
+
+    Args:
+        gmail_service: Gmail API service instance
+        mailbox: Account identifier, e.g. (user_id, api_key)
+        labels: Label names or ids
+
+    Returns:
+        List of label ids; unknown labels are passed through unchanged
+    """
+    if not labels:
+        return []
+    label_ids = _label_ids_cache.get(mailbox)
+    if label_ids is None:
+        results = await asyncio.to_thread(
+            gmail_service.users().labels().list(userId="me").execute
+        )
+        _cache_label_ids(mailbox, results.get("labels", []))
+        label_ids = _label_ids_cache[mailbox]
+    return [label_ids.get(label, label) for label in labels]
+
+
+def _cache_attachment(key, data):
+    """Cache attachment bytes, skipping ones too large for the cache"""
+    if key is not None and data and len(data) <= ATTACHMENT_CACHE_BYTES:
+        _attachment_cache[key] = data
+
+
+async def download_attachment(
+    gmail_service, user_id, message_id, attachment_id, mailbox=None
+):
+    """
+    Download attachment data from Gmail
+
+    mailbox identifies the account, e.g. (user_id, api_key), for caching;
+    downloads are not cached when it is None.
+    """
+    key = (mailbox, message_id, attachment_id) if mailbox is not None else None
+    if key is not None and key in _attachment_cache:
+        return _attachment_cache[key]
+
+    try:
+        attachment = await asyncio.to_thread(
             gmail_service.users()
             .messages()
             .attachments()
             .get(userId=user_id, messageId=message_id, id=attachment_id)
-            .execute()
+            .execute
         )
-        return urlsafe_b64decode(attachment["data"])
+        data = urlsafe_b64decode(attachment["data"])
     except Exception as e:
         logger.error(f"Error downloading attachment: {str(e)}")
         return None
 
+    _cache_attachment(key, data)
+    return data
+
+
+async def send_message(gmail_service, message):
+    """
+    Send a MIME message through the Gmail upload endpoint
+
+    The message bytes are uploaded as message/rfc822 rather than base64-encoded
+    into a JSON "raw" field, which avoids holding extra encoded copies of large
+    attachments in memory.
+
+    Args:
+        gmail_service: Gmail API service instance
+        message: email.message.Message to send
+
+    Returns:
+        The sent message resource
+    """
+    media = MediaIoBaseUpload(io.BytesIO(message.as_bytes()), mimetype="message/rfc822")
+    return await asyncio.to_thread(
+        gmail_service.users().messages().send(userId="me", media_body=media).execute
+    )
+
+
+# System labels left out of the resource listing
+SKIPPED_SYSTEM_LABELS = frozenset({"CHAT", "SENT", "SPAM", "TRASH", "DRAFT"})
+
+# Partial-response masks so Gmail only returns the fields the handlers read
+MESSAGE_LIST_FIELDS = "messages/id"
+MESSAGE_METADATA_FIELDS = "id,payload/headers"
+MESSAGE_FULL_FIELDS = "id,threadId,historyId,labelIds,snippet,payload"
+MESSAGE_SUMMARY_FIELDS = "id,threadId,historyId,labelIds,snippet,payload/headers"
+LABEL_COUNT_FIELDS = "messagesTotal,messagesUnread"
+ATTACHMENT_PARTS_FIELDS = "payload(filename,mimeType,parts)"
+
+
+def message_fetch_params(include_payload, headers):
+    """
+    messages().get parameters for read_emails
+
+    The full payload is only requested when bodies or attachments are read;
+    otherwise metadata format returns just the given headers.
+
+    Args:
+        include_payload: Whether message bodies or attachments are needed
+        headers: Header names the caller reads
+
+    Returns:
+        Dict of keyword arguments for get_messages
+    """
+    if include_payload:
+        return {"format": "full", "fields": MESSAGE_FULL_FIELDS}
+    return {
+        "format": "metadata",
+        "metadataHeaders": sorted(headers),
+        "fields": MESSAGE_SUMMARY_FIELDS,
+    }
+
+
+# Gmail rejects batch requests with more than 100 calls
+MAX_BATCH_REQUESTS = 100
+# messages().batchModify accepts at most 1000 message ids per call
+MAX_BATCH_MODIFY_IDS = 1000
+# Requests run at once per mailbox when failed requests are retried one by one
+MAX_CONCURRENT_REQUESTS = 5
+# Single-request limits keyed by Gmail service, which create_gmail_service
+# caches per mailbox, so concurrent tool calls share one limit
+_request_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Retries for requests rejected with a rate limit or server error
+MAX_REQUEST_RETRIES = 3
+RETRY_INITIAL_DELAY = 1.0  # seconds
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+def is_retryable_error(exception) -> bool:
+    """Whether a failed Gmail request may succeed if it is sent again"""
+    if isinstance(exception, (ConnectionError, TimeoutError, httplib2.HttpLib2Error)):
+        return True
+    status = getattr(getattr(exception, "resp", None), "status", None)
+    if status is None:
+        return False
+    # Gmail reports per-user rate limits as 403 rateLimitExceeded
+    return int(status) in RETRYABLE_STATUSES or (
+        int(status) == 403 and "ratelimitexceeded" in str(exception).lower()
+    )
+
+
+def retry_delay(attempt) -> float:
+    """Exponential backoff with jitter before the given retry (1-based)"""
+    return RETRY_INITIAL_DELAY * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+
+
+async def execute_batch(gmail_service, requests):
+    """
+    Execute Gmail API requests through batch HTTP calls
+
+    Batches run concurrently in worker threads so the blocking HTTP calls don't
+    stall the event loop; ThreadLocalAuthorizedHttp gives each thread its own
+    connection. If a batch call itself fails, its requests are retried one by
+    one, at most MAX_CONCURRENT_REQUESTS at a time across all calls for the
+    same service. Requests inside a batch
+    that fail with a rate limit or server error, which Gmail often returns for
+    some calls of a full batch, are retried one by one with backoff. Requests
+    must therefore be safe to repeat.
+
+    Args:
+        gmail_service: Gmail API service instance
+        requests: List of unexecuted API requests
+
+    Returns:
+        A list aligned with requests holding each response, or None for
+        requests that still failed after retrying
+    """
+    responses = [None] * len(requests)
+    errors = {}
+
+    def callback(request_id, response, exception):
+        if exception is not None:
+            errors[int(request_id)] = exception
+            return
+        responses[int(request_id)] = response
+
+    semaphore = _request_semaphores.get(gmail_service)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        _request_semaphores[gmail_service] = semaphore
+
+    async def execute_single(index, attempt=0):
+        while True:
+            if attempt:
+                await asyncio.sleep(retry_delay(attempt))
+            async with semaphore:
+                try:
+                    responses[index] = await asyncio.to_thread(requests[index].execute)
+                    errors.pop(index, None)
+                    return
+                except Exception as e:
+                    errors[index] = e
+            attempt += 1
+            if attempt > MAX_REQUEST_RETRIES or not is_retryable_error(errors[index]):
+                logger.error(f"Request {index} failed: {str(errors[index])}")
+                return
+
+    async def execute(start):
+        indexes = range(start, min(start + MAX_BATCH_REQUESTS, len(requests)))
+        batch = gmail_service.new_batch_http_request(callback=callback)
+        for index in indexes:
+            batch.add(requests[index], request_id=str(index))
+        try:
+            await asyncio.to_thread(batch.execute)
+        except Exception as e:
+            logger.warning(
+                f"Batch call failed, retrying {len(indexes)} requests one by one: {str(e)}"
+            )
+            await asyncio.gather(*(execute_single(index) for index in indexes))
+            return
+
+        retries = []
+        for index in indexes:
+            if index not in errors:
+                continue
+            if is_retryable_error(errors[index]):
+                retries.append(execute_single(index, attempt=1))
+            else:
+                logger.error(f"Batch request {index} failed: {str(errors[index])}")
+        await asyncio.gather(*retries)
+
+    await asyncio.gather(
+        *(execute(start) for start in range(0, len(requests), MAX_BATCH_REQUESTS))
+    )
+
+    return responses
+
+
+async def get_messages(gmail_service, messages, **kwargs):
+    """
+    Fetch Gmail messages in batched calls
+
+    Args:
+        gmail_service: Gmail API service instance
+        messages: List of message stubs, as returned by messages().list
+        **kwargs: Extra messages().get parameters, such as format
+
+    Returns:
+        A list aligned with messages holding each message, or None for
+        messages that could not be fetched
+    """
+    return await execute_batch(
+        gmail_service,
+        [
+            gmail_service.users()
+            .messages()
+            .get(userId="me", id=message["id"], **kwargs)
+            for message in messages
+        ],
+    )
+
+
+async def download_attachments(
+    gmail_service, user_id, message_id, attachment_ids, mailbox=None
+):
+    """
+    Download several attachments of one message in batched calls
+
+    Args:
+        gmail_service: Gmail API service instance
+        user_id: Gmail user id, usually "me"
+        message_id: ID of the message holding the attachments
+        attachment_ids: List of attachment IDs to download
+        mailbox: Account identifier, e.g. (user_id, api_key), used to cache
+            downloads; nothing is cached when None
+
+    Returns:
+        A list aligned with attachment_ids holding each attachment's bytes, or
+        None for attachments that could not be downloaded
+    """
+    keys = [
+        (mailbox, message_id, attachment_id) if mailbox is not None else None
+        for attachment_id in attachment_ids
+    ]
+    results = [_attachment_cache.get(key) if key else None for key in keys]
+    missing = [index for index, data in enumerate(results) if data is None]
+
+    attachments = await execute_batch(
+        gmail_service,
+        [
+            gmail_service.users()
+            .messages()
+            .attachments()
+            .get(userId=user_id, messageId=message_id, id=attachment_ids[index])
+            for index in missing
+        ],
+    )
+    for index, attachment in zip(missing, attachments):
+        if attachment:
+            results[index] = urlsafe_b64decode(attachment["data"])
+            _cache_attachment(keys[index], results[index])
+
+    return results
+
+
+async def download_attachment_with_type(
+    gmail_service, user_id, message_id, attachment_id, filename, mailbox=None
+):
+    """
+    Download an attachment and look up its MIME type in one batched call
+
+    Attachment ids change between message fetches, so the type is taken from
+    the message part with the same filename.
+
+    Args:
+        gmail_service: Gmail API service instance
+        user_id: Gmail user id, usually "me"
+        message_id: ID of the message holding the attachment
+        attachment_id: ID of the attachment to download
+        filename: Filename of the attachment
+        mailbox: Account identifier, e.g. (user_id, api_key), used to cache
+            downloads; nothing is cached when None
+
+    Returns:
+        Tuple of the attachment bytes, or None if the download failed, and its
+        MIME type
+    """
+    key = (mailbox, message_id, attachment_id) if mailbox is not None else None
+    data = _attachment_cache.get(key) if key is not None else None
+
+    messages = gmail_service.users().messages()
+    requests = [
+        messages.get(
+            userId=user_id,
+            id=message_id,
+            format="full",
+            fields=ATTACHMENT_PARTS_FIELDS,
+        )
+    ]
+    if data is None:
+        requests.append(
+            messages.attachments().get(
+                userId=user_id, messageId=message_id, id=attachment_id
+            )
+        )
+    responses = await execute_batch(gmail_service, requests)
+
+    mime_type = "application/octet-stream"
+    if responses[0]:
+        content = walk_payload(responses[0].get("payload", {}), want=())
+        _remember_attachment_types(mailbox, message_id, content["attachments"])
+        for attachment_info in content["attachments"]:
+            if attachment_info["filename"] == filename:
+                mime_type = attachment_info["mimeType"]
+                break
+
+    if data is None and responses[-1]:
+        data = urlsafe_b64decode(responses[-1]["data"])
+        _cache_attachment(key, data)
+    return data, mime_type
+
+
+def format_attachment_link(filename, mime_type, size, download_url, expires_at):
+    """Describe an uploaded attachment and its temporary download URL"""
+    expires_in = max(round((expires_at - time.time()) / 60), 1)
+    return (
+        f"Attachment: {filename}\n"
+        f"Type: {mime_type}\n"
+        f"Size: {size / 1024:.1f} KB\n"
+        f"Download URL (expires in {expires_in} minutes): {download_url}"
+    )
+
 
 def plain_text_to_html(text):
     """Convert plain text to HTML, preserving line breaks and whitespace.
@@ -163,6 +678,9 @@ def create_message_with_attachments(
 
     Sends the body as text/html to prevent Gmail's server-side hard-wrapping
     of text/plain content at ~78 characters.
+
+    Attachment content is a base64 string from the tool arguments, or raw bytes
+    when it is already decoded, e.g. when forwarding.
     """
     _no_wrap_policy = email.policy.SMTPUTF8.clone(max_line_length=998)
 
@@ -183,18 +701,21 @@ def create_message_with_attachments(
     if attachments:
         for attachment in attachments:
             filename = attachment.get("filename", "attachment")
-            content = attachment.get("content")  # Base64 encoded content
+            content = attachment.get("content")  # Base64 string or raw bytes
             mime_type = attachment.get("mimeType", "application/octet-stream")
 
             if not content:
                 continue
 
             # Decode base64 content
-            try:
-                file_data = base64.b64decode(content)
-            except Exception as e:
-                logger.error(f"Error decoding attachment {filename}: {str(e)}")
-                continue
+            if isinstance(content, bytes):
+                file_data = content
+            else:
+                try:
+                    file_data = b64decode(content)
+                except Exception as e:
+                    logger.error(f"Error decoding attachment {filename}: {str(e)}")
+                    continue
 
             # Determine main type and subtype
             main_type, sub_type = (
@@ -213,10 +734,335 @@ def create_message_with_attachments(
     return message
 
 
+class OrjsonModel(JsonModel):
+    """JsonModel that parses API responses with orjson when it is installed"""
+
+    def deserialize(self, content):
+        if orjson is None:
+            return super().deserialize(content)
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+# httplib2.Http connections per thread, shared by every mailbox's service so
+# open TLS connections to Google survive service rebuilds and user switches
+_thread_connections = threading.local()
+
+
+def _thread_http() -> httplib2.Http:
+    """The calling thread's shared httplib2.Http"""
+    http = getattr(_thread_connections, "http", None)
+    if http is None:
+        http = _thread_connections.http = httplib2.Http()
+    return http
+
+
+class ThreadLocalAuthorizedHttp:
+    """
+    AuthorizedHttp stand-in that keeps one connection per thread
+
+    httplib2.Http is not thread-safe, so each thread calling the shared Gmail
+    service gets its own AuthorizedHttp. All of them wrap the same credentials
+    object, so an expired token is refreshed once rather than per thread. The
+    underlying connections come from _thread_http and are shared between
+    services.
+    """
+
+    def __init__(self, credentials):
+        self.credentials = credentials
+        self._local = threading.local()
+
+    def _http(self) -> AuthorizedHttp:
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = AuthorizedHttp(
+                self.credentials, http=_thread_http()
+            )
+        return http
+
+    def request(self, *args, **kwargs):
+        return self._http().request(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._http(), name)
+
+
+# Reuse Gmail services across tool calls; entries are dropped after the TTL
+# or shortly before their OAuth token expires, whichever comes first
+SERVICE_CACHE_TTL = 300.0  # seconds
+SERVICE_CACHE_MAXSIZE = 256
+SERVICE_EXPIRY_MARGIN = 60.0  # seconds
+_service_cache: TTLCache = TTLCache(
+    maxsize=SERVICE_CACHE_MAXSIZE, ttl=SERVICE_CACHE_TTL, timer=time.time
+)
+_service_locks: Dict[tuple, asyncio.Lock] = {}
+
+
+def _service_cache_expiry(credentials) -> float:
+    """Time after which a cached service must be rebuilt"""
+    expires_at = time.time() + SERVICE_CACHE_TTL
+    expiry = getattr(credentials, "expiry", None)
+    if expiry is not None:
+        # google-auth stores expiry as a naive UTC datetime
+        token_expires_at = expiry.replace(tzinfo=timezone.utc).timestamp()
+        expires_at = min(expires_at, token_expires_at - SERVICE_EXPIRY_MARGIN)
+    return expires_at
+
+
+@functools.lru_cache(maxsize=None)
+def _gmail_discovery_document():
+    """Gmail discovery document bundled with googleapiclient, read from disk once"""
+    return get_static_doc("gmail", "v1")
+
+
 async def create_gmail_service(user_id, api_key=None):
-    """Create a new Gmail service instance for this request"""
-    credentials = await get_credentials(user_id, SERVICE_NAME, api_key=api_key)
-    return build("gmail", "v1", credentials=credentials)
+    """Get a cached Gmail service instance, building one on a miss or after expiry"""
+    key = (user_id, api_key)
+
+    entry = _service_cache.get(key)
+    if entry is not None and entry[0] > time.time():
+        return entry[1]
+
+    # Per-key lock so concurrent calls for the same user build a single service
+    lock = _service_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            entry = _service_cache.get(key)
+            if entry is not None and entry[0] > time.time():
+                return entry[1]
+
+            credentials = await get_credentials(user_id, SERVICE_NAME, api_key=api_key)
+            # Build from the bundled discovery document, skipping the network
+            # fetch and the discovery cache; it is parsed per build because
+            # building fills in the method descriptions
+            document = _gmail_discovery_document()
+            service = build_from_document(
+                orjson.loads(document) if orjson is not None else document,
+                http=ThreadLocalAuthorizedHttp(credentials),
+                model=OrjsonModel(),
+            )
+            _service_cache[key] = (_service_cache_expiry(credentials), service)
+            return service
+    finally:
+        # The lock is only needed while a build is in flight, so drop it once
+        # nobody holds it rather than keeping one per user forever
+        if not lock.locked() and _service_locks.get(key) is lock:
+            del _service_locks[key]
+
+
+# Tool definitions are static, so they are built once at import
+TOOLS = [
+    Tool(
+        name="read_emails",
+        description="Search and read emails in Gmail with full text body and attachment information. Supports structured JSON output for programmatic consumption.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (e.g., 'from:someone@example.com' or 'subject:important')",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of emails to return (default: 10, max: 100)",
+                },
+                "include_body": {
+                    "type": "boolean",
+                    "description": "Include email body text in results (default: true)",
+                },
+                "include_attachments_info": {
+                    "type": "boolean",
+                    "description": "Include attachment information in results (default: true)",
+                },
+                "output_format": {
+                    "type": "string",
+                    "enum": ["text", "structured"],
+                    "description": "Output format: 'text' for human-readable (default), 'structured' for machine-readable JSON with typed fields (id, threadId, historyId, from, to, cc, bcc, subject, date, snippet, labels, isUnread, messageId, body, attachments)",
+                },
+                "label_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Filter by Gmail label IDs (e.g., ['INBOX', 'UNREAD']). Applied in addition to query. Only used with output_format 'structured'.",
+                },
+                "include_headers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Additional headers to include in structured output (e.g., ['Reply-To', 'In-Reply-To']). From, To, Cc, Bcc, Subject, Date are always included. Only used with output_format 'structured'.",
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="send_email",
+        description="Send an email through Gmail with optional attachments",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "to": {
+                    "type": "string",
+                    "description": "Recipient email address",
+                },
+                "subject": {"type": "string", "description": "Email subject"},
+                "body": {
+                    "type": "string",
+                    "description": "Email body (plain text)",
+                },
+                "cc": {
+                    "type": "string",
+                    "description": "CC recipients (comma separated)",
+                },
+                "bcc": {
+                    "type": "string",
+                    "description": "BCC recipients (comma separated)",
+                },
+                "attachments": {
+                    "type": "array",
+                    "description": "Array of attachments to include",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "filename": {
+                                "type": "string",
+                                "description": "Name of the file",
+                            },
+                            "content": {
+                                "type": "string",
+                                "description": "Base64-encoded file content",
+                            },
+                            "mimeType": {
+                                "type": "string",
+                                "description": "MIME type of the file (e.g., 'application/pdf', 'image/png')",
+                            },
+                        },
+                        "required": ["filename", "content", "mimeType"],
+                    },
+                },
+                "track_delivery": {
+                    "type": "boolean",
+                    "description": "When true, returns structured JSON with channelMessageId and conversationId for delivery tracking",
+                },
+            },
+            "required": ["to", "subject", "body"],
+        },
+    ),
+    Tool(
+        name="forward_email",
+        description="Forward an email to recipients, preserving original content and attachments",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_id": {
+                    "type": "string",
+                    "description": "ID of the email to forward",
+                },
+                "to": {
+                    "type": "string",
+                    "description": "Recipient email address(es) (comma separated)",
+                },
+                "cc": {
+                    "type": "string",
+                    "description": "CC recipients (comma separated)",
+                },
+                "bcc": {
+                    "type": "string",
+                    "description": "BCC recipients (comma separated)",
+                },
+                "additional_message": {
+                    "type": "string",
+                    "description": "Additional message to add before the forwarded content",
+                },
+                "include_attachments": {
+                    "type": "boolean",
+                    "description": "Whether to include original attachments (default: true)",
+                },
+            },
+            "required": ["email_id", "to"],
+        },
+    ),
+    Tool(
+        name="update_email",
+        description="Update email labels (mark as read/unread, move to folders)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_id": {
+                    "type": "string",
+                    "description": "Email ID to modify",
+                },
+                "add_labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Label names or ids to add (e.g., 'INBOX', 'STARRED', 'IMPORTANT')",
+                },
+                "remove_labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Label names or ids to remove (e.g., 'UNREAD')",
+                },
+            },
+            "required": ["email_id"],
+        },
+    ),
+    Tool(
+        name="batch_modify_emails",
+        description="Update labels on many emails at once (mark as read/unread, move to folders)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Email IDs to modify",
+                },
+                "add_labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Label names or ids to add (e.g., 'INBOX', 'STARRED', 'IMPORTANT')",
+                },
+                "remove_labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Label names or ids to remove (e.g., 'UNREAD')",
+                },
+            },
+            "required": ["email_ids"],
+        },
+    ),
+    Tool(
+        name="get_attachment",
+        description="Get a temporary download URL for an email attachment",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_id": {
+                    "type": "string",
+                    "description": "ID of the email containing the attachment",
+                },
+                "attachment_id": {
+                    "type": "string",
+                    "description": "ID of the attachment to download (from read_emails results)",
+                },
+                "filename": {
+                    "type": "string",
+                    "description": "Filename of the attachment (from read_emails results)",
+                },
+                "mime_type": {
+                    "type": "string",
+                    "description": "MIME type of the attachment (from read_emails results)",
+                },
+            },
+            "required": ["email_id", "attachment_id", "filename"],
+        },
+    ),
+]
 
 
 def create_server(user_id, api_key=None):
@@ -240,32 +1086,40 @@ def create_server(user_id, api_key=None):
         )
 
         try:
-            # Get all labels
-            results = gmail_service.users().labels().list(userId="me").execute()
+            # Get all labels without blocking the event loop
+            results = await asyncio.to_thread(
+                gmail_service.users().labels().list(userId="me").execute
+            )
             labels = results.get("labels", [])
+            _cache_label_ids((server.user_id, server.api_key), labels)
+
+            # Skip system labels that aren't useful to show
+            labels = [
+                label
+                for label in labels
+                if not (
+                    label.get("type") == "system"
+                    and label.get("id") in SKIPPED_SYSTEM_LABELS
+                )
+            ]
 
-            resources = []
-            for label in labels:
-                # Skip system labels that aren't useful to show
-                if label.get("type") == "system" and label.get("id") in [
-                    "CHAT",
-                    "SENT",
-                    "SPAM",
-                    "TRASH",
-                    "DRAFT",
-                ]:
-                    continue
+            # Get message counts in batched calls
+            label_details = await execute_batch(
+                gmail_service,
+                [
+                    gmail_service.users()
+                    .labels()
+                    .get(userId="me", id=label.get("id"), fields=LABEL_COUNT_FIELDS)
+                    for label in labels
+                ],
+            )
 
+            resources = []
+            for label, label_data in zip(labels, label_details):
                 label_id = label.get("id")
                 label_name = label.get("name", "Unknown Label")
 
-                # Get message count for this label
-                label_data = (
-                    gmail_service.users()
-                    .labels()
-                    .get(userId="me", id=label_id)
-                    .execute()
-                )
+                label_data = label_data or {}
                 total_messages = label_data.get("messagesTotal", 0)
                 unread_messages = label_data.get("messagesUnread", 0)
 
@@ -302,11 +1156,16 @@ def create_server(user_id, api_key=None):
         label_id = uri_str.replace("gmail://label/", "")
 
         # Get messages in this label
-        results = (
+        results = await asyncio.to_thread(
             gmail_service.users()
             .messages()
-            .list(userId="me", labelIds=[label_id], maxResults=10)
-            .execute()
+            .list(
+                userId="me",
+                labelIds=[label_id],
+                maxResults=10,
+                fields=MESSAGE_LIST_FIELDS,
+            )
+            .execute
         )
 
         messages = results.get("messages", [])
@@ -318,229 +1177,55 @@ def create_server(user_id, api_key=None):
                 )
             ]
 
-        # Format messages
-        formatted_messages = []
-
-        for message in messages:
-            # Get message data
-            msg_data = (
-                gmail_service.users()
-                .messages()
-                .get(
-                    userId="me",
-                    id=message["id"],
-                    format="metadata",
-                    metadataHeaders=["Subject", "From", "Date"],
-                )
-                .execute()
-            )
+        # Get message data for all messages in batched calls
+        messages_data = await get_messages(
+            gmail_service,
+            messages,
+            format="metadata",
+            metadataHeaders=sorted(SUMMARY_HEADERS),
+            fields=MESSAGE_METADATA_FIELDS,
+        )
+
+        # Format messages into a single buffer
+        output = io.StringIO()
+        separator = ""
+        failed_ids = []
+        for message, msg_data in zip(messages, messages_data):
+            if msg_data is None:
+                failed_ids.append(message["id"])
+                continue
 
             # Extract headers
-            headers = {}
-            for header in msg_data.get("payload", {}).get("headers", []):
-                headers[header["name"]] = header["value"]
+            headers = extract_headers(msg_data, SUMMARY_HEADERS)
 
             subject = headers.get("Subject", "No Subject")
             sender = headers.get("From", "Unknown")
             date = headers.get("Date", "Unknown date")
 
             # Format message summary
-            message_summary = (
+            output.write(separator)
+            separator = "\n"
+            output.write(
                 f"ID: gmail://message/{message['id']}\n"
                 f"Subject: {subject}\n"
                 f"From: {sender}\n"
                 f"Date: {date}\n"
                 f"---\n"
             )
-            formatted_messages.append(message_summary)
 
-        content = "\n".join(formatted_messages)
-        return [ReadResourceContents(content=content, mime_type="text/plain")]
+        if failed_ids:
+            output.write(separator)
+            output.write(
+                f"Could not fetch {len(failed_ids)} messages: {', '.join(failed_ids)}\n"
+            )
+
+        return [ReadResourceContents(content=output.getvalue(), mime_type="text/plain")]
 
     @server.list_tools()
     async def handle_list_tools() -> list[Tool]:
         """List available email tools"""
         logger.info(f"Listing email tools for user: {server.user_id}")
-        return [
-            Tool(
-                name="read_emails",
-                description="Search and read emails in Gmail with full text body and attachment information. Supports structured JSON output for programmatic consumption.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query (e.g., 'from:someone@example.com' or 'subject:important')",
-                        },
-                        "max_results": {
-                            "type": "integer",
-                            "description": "Maximum number of emails to return (default: 10, max: 100)",
-                        },
-                        "include_body": {
-                            "type": "boolean",
-                            "description": "Include email body text in results (default: true)",
-                        },
-                        "include_attachments_info": {
-                            "type": "boolean",
-                            "description": "Include attachment information in results (default: true)",
-                        },
-                        "output_format": {
-                            "type": "string",
-                            "enum": ["text", "structured"],
-                            "description": "Output format: 'text' for human-readable (default), 'structured' for machine-readable JSON with typed fields (id, threadId, historyId, from, to, cc, bcc, subject, date, snippet, labels, isUnread, messageId, body, attachments)",
-                        },
-                        "label_ids": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Filter by Gmail label IDs (e.g., ['INBOX', 'UNREAD']). Applied in addition to query. Only used with output_format 'structured'.",
-                        },
-                        "include_headers": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Additional headers to include in structured output (e.g., ['Reply-To', 'In-Reply-To']). From, To, Cc, Bcc, Subject, Date are always included. Only used with output_format 'structured'.",
-                        },
-                    },
-                    "required": ["query"],
-                },
-            ),
-            Tool(
-                name="send_email",
-                description="Send an email through Gmail with optional attachments",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "to": {
-                            "type": "string",
-                            "description": "Recipient email address",
-                        },
-                        "subject": {"type": "string", "description": "Email subject"},
-                        "body": {
-                            "type": "string",
-                            "description": "Email body (plain text)",
-                        },
-                        "cc": {
-                            "type": "string",
-                            "description": "CC recipients (comma separated)",
-                        },
-                        "bcc": {
-                            "type": "string",
-                            "description": "BCC recipients (comma separated)",
-                        },
-                        "attachments": {
-                            "type": "array",
-                            "description": "Array of attachments to include",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "filename": {
-                                        "type": "string",
-                                        "description": "Name of the file",
-                                    },
-                                    "content": {
-                                        "type": "string",
-                                        "description": "Base64-encoded file content",
-                                    },
-                                    "mimeType": {
-                                        "type": "string",
-                                        "description": "MIME type of the file (e.g., 'application/pdf', 'image/png')",
-                                    },
-                                },
-                                "required": ["filename", "content", "mimeType"],
-                            },
-                        },
-                        "track_delivery": {
-                            "type": "boolean",
-                            "description": "When true, returns structured JSON with channelMessageId and conversationId for delivery tracking",
-                        },
-                    },
-                    "required": ["to", "subject", "body"],
-                },
-            ),
-            Tool(
-                name="forward_email",
-                description="Forward an email to recipients, preserving original content and attachments",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "email_id": {
-                            "type": "string",
-                            "description": "ID of the email to forward",
-                        },
-                        "to": {
-                            "type": "string",
-                            "description": "Recipient email address(es) (comma separated)",
-                        },
-                        "cc": {
-                            "type": "string",
-                            "description": "CC recipients (comma separated)",
-                        },
-                        "bcc": {
-                            "type": "string",
-                            "description": "BCC recipients (comma separated)",
-                        },
-                        "additional_message": {
-                            "type": "string",
-                            "description": "Additional message to add before the forwarded content",
-                        },
-                        "include_attachments": {
-                            "type": "boolean",
-                            "description": "Whether to include original attachments (default: true)",
-                        },
-                    },
-                    "required": ["email_id", "to"],
-                },
-            ),
-            Tool(
-                name="update_email",
-                description="Update email labels (mark as read/unread, move to folders)",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "email_id": {
-                            "type": "string",
-                            "description": "Email ID to modify",
-                        },
-                        "add_labels": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Labels to add (e.g., 'INBOX', 'STARRED', 'IMPORTANT')",
-                        },
-                        "remove_labels": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Labels to remove (e.g., 'UNREAD')",
-                        },
-                    },
-                    "required": ["email_id"],
-                },
-            ),
-            Tool(
-                name="get_attachment",
-                description="Get a temporary download URL for an email attachment",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "email_id": {
-                            "type": "string",
-                            "description": "ID of the email containing the attachment",
-                        },
-                        "attachment_id": {
-                            "type": "string",
-                            "description": "ID of the attachment to download (from read_emails results)",
-                        },
-                        "filename": {
-                            "type": "string",
-                            "description": "Filename of the attachment (from read_emails results)",
-                        },
-                        "mime_type": {
-                            "type": "string",
-                            "description": "MIME type of the attachment (from read_emails results)",
-                        },
-                    },
-                    "required": ["email_id", "attachment_id", "filename"],
-                },
-            ),
-        ]
+        return TOOLS
 
     @server.call_tool()
     async def handle_call_tool(
@@ -564,14 +1249,22 @@ def create_server(user_id, api_key=None):
             include_body = arguments.get("include_body", True)
             include_attachments_info = arguments.get("include_attachments_info", True)
             output_format = arguments.get("output_format", "text")
+            mailbox = (server.user_id, server.api_key)
 
             # Build the list request
-            list_kwargs = {"userId": "me", "q": query, "maxResults": max_results}
+            list_kwargs = {
+                "userId": "me",
+                "q": query,
+                "maxResults": max_results,
+                "fields": MESSAGE_LIST_FIELDS,
+            }
             label_ids = arguments.get("label_ids")
             if label_ids:
                 list_kwargs["labelIds"] = label_ids
 
-            results = gmail_service.users().messages().list(**list_kwargs).execute()
+            results = await asyncio.to_thread(
+                gmail_service.users().messages().list(**list_kwargs).execute
+            )
 
             messages = results.get("messages", [])
 
@@ -583,35 +1276,27 @@ def create_server(user_id, api_key=None):
                         "resultCount": 0,
                         "query": query,
                     }
-                    return [TextContent(type="text", text=json.dumps(result_data))]
+                    return [TextContent(type="text", text=to_json(result_data))]
 
                 extra_headers = arguments.get("include_headers", [])
-                standard_headers = [
-                    "From",
-                    "To",
-                    "Cc",
-                    "Bcc",
-                    "Subject",
-                    "Date",
-                    "Message-ID",
-                ]
-                all_headers = list(
-                    dict.fromkeys(standard_headers + [h for h in extra_headers])
+                wanted_headers = STRUCTURED_HEADERS.union(extra_headers)
+
+                full_messages = await get_messages(
+                    gmail_service,
+                    messages,
+                    **message_fetch_params(
+                        include_body or include_attachments_info, wanted_headers
+                    ),
                 )
 
                 email_objects = []
-                for message in messages:
-                    msg = (
-                        gmail_service.users()
-                        .messages()
-                        .get(userId="me", id=message["id"], format="full")
-                        .execute()
-                    )
+                failed_ids = []
+                for message, msg in zip(messages, full_messages):
+                    if msg is None:
+                        failed_ids.append(message["id"])
+                        continue
 
-                    headers = {}
-                    for header in msg.get("payload", {}).get("headers", []):
-                        if header["name"] in all_headers:
-                            headers[header["name"]] = header["value"]
+                    headers = extract_headers(msg, wanted_headers)
 
                     labels = msg.get("labelIds", [])
 
@@ -636,17 +1321,22 @@ def create_server(user_id, api_key=None):
                             h: headers.get(h, "") for h in extra_headers
                         }
 
+                    if include_body or include_attachments_info:
+                        content = walk_payload(
+                            msg.get("payload", {}),
+                            want=("text", "html") if include_body else (),
+                        )
+
                     if include_body:
-                        payload = msg.get("payload", {})
-                        body = parse_email_body(payload)
                         email_obj["body"] = {
-                            "text": body.get("text", ""),
-                            "html": body.get("html", ""),
+                            "text": content["text"],
+                            "html": content["html"],
                         }
 
                     if include_attachments_info:
-                        payload = msg.get("payload", {})
-                        attachments = get_attachments_info(payload)
+                        _remember_attachment_types(
+                            mailbox, message["id"], content["attachments"]
+                        )
                         email_obj["attachments"] = [
                             {
                                 "filename": att["filename"],
@@ -654,7 +1344,7 @@ def create_server(user_id, api_key=None):
                                 "size": att.get("size", 0),
                                 "attachmentId": att.get("attachmentId", ""),
                             }
-                            for att in attachments
+                            for att in content["attachments"]
                         ]
 
                     email_objects.append(email_obj)
@@ -664,7 +1354,10 @@ def create_server(user_id, api_key=None):
                     "resultCount": len(email_objects),
                     "query": query,
                 }
-                return [TextContent(type="text", text=json.dumps(result_data))]
+                if failed_ids:
+                    # Messages the list returned but that could not be fetched
+                    result_data["failedIds"] = failed_ids
+                return [TextContent(type="text", text=to_json(result_data))]
 
             # --- Default text output (unchanged) ---
             if not messages:
@@ -674,34 +1367,48 @@ def create_server(user_id, api_key=None):
                     )
                 ]
 
-            email_summaries = []
-            for message in messages:
-                # Fetch full message to get body and attachments
-                msg = (
-                    gmail_service.users()
-                    .messages()
-                    .get(userId="me", id=message["id"], format="full")
-                    .execute()
+            # Fetch full messages only when body or attachments are shown
+            full_messages = await get_messages(
+                gmail_service,
+                messages,
+                **message_fetch_params(
+                    include_body or include_attachments_info, SUMMARY_HEADERS
+                ),
+            )
+
+            # Write summaries straight into the response instead of joining parts
+            output = io.StringIO()
+            failed_ids = [
+                message["id"]
+                for message, msg in zip(messages, full_messages)
+                if msg is None
+            ]
+            if failed_ids:
+                output.write(
+                    f"Found {len(messages)} emails, {len(failed_ids)} could not be "
+                    f"fetched (IDs: {', '.join(failed_ids)}):\n\n"
                 )
+            else:
+                output.write(f"Found {len(messages)} emails:\n\n")
+            separator = ""
+            for message, msg in zip(messages, full_messages):
+                if msg is None:
+                    continue
 
                 # Extract headers
-                subject = "No Subject"
-                sender = "Unknown"
-                date = "Unknown"
-                for header in msg.get("payload", {}).get("headers", []):
-                    if header["name"] == "Subject":
-                        subject = header["value"]
-                    elif header["name"] == "From":
-                        sender = header["value"]
-                    elif header["name"] == "Date":
-                        date = header["value"]
+                headers = extract_headers(msg, SUMMARY_HEADERS)
+                subject = headers.get("Subject", "No Subject")
+                sender = headers.get("From", "Unknown")
+                date = headers.get("Date", "Unknown")
 
                 # Get labels
                 labels = msg.get("labelIds", [])
                 is_unread = "UNREAD" in labels
 
                 # Build email summary
-                email_summary = (
+                output.write(separator)
+                separator = "\n\n---\n\n"
+                output.write(
                     f"ID: {message['id']}\n"
                     f"From: {sender}\n"
                     f"Subject: {subject}\n"
@@ -710,42 +1417,48 @@ def create_server(user_id, api_key=None):
                     f"Labels: {', '.join(labels)}\n"
                 )
 
+                if include_body or include_attachments_info:
+                    # Only the preferred body is shown, so the other stays encoded
+                    body = walk_payload(
+                        msg.get("payload", {}),
+                        want=("text", "html") if include_body else (),
+                        first_only=True,
+                        with_attachments=include_attachments_info,
+                    )
+
                 # Parse email body if requested
                 if include_body:
-                    payload = msg.get("payload", {})
-                    body = parse_email_body(payload)
 
                     if body["text"]:
-                        email_summary += f"\nBody (Text):\n{body['text'][:1000]}"
+                        output.write(f"\nBody (Text):\n{body['text'][:1000]}")
                         if len(body["text"]) > 1000:
-                            email_summary += f"\n... (truncated, total length: {len(body['text'])} chars)"
+                            output.write(
+                                f"\n... (truncated, total length: {len(body['text'])} chars)"
+                            )
                     elif body["html"]:
-                        email_summary += f"\nBody (HTML):\n{body['html'][:1000]}"
+                        output.write(f"\nBody (HTML):\n{body['html'][:1000]}")
                         if len(body["html"]) > 1000:
-                            email_summary += f"\n... (truncated, total length: {len(body['html'])} chars)"
+                            output.write(
+                                f"\n... (truncated, total length: {len(body['html'])} chars)"
+                            )
                     else:
-                        email_summary += "\nBody: (No text content found)"
+                        output.write("\nBody: (No text content found)")
 
                 # Get attachment info if requested
                 if include_attachments_info:
-                    payload = msg.get("payload", {})
-                    attachments = get_attachments_info(payload)
+                    attachments = body["attachments"]
+                    _remember_attachment_types(mailbox, message["id"], attachments)
                     if attachments:
-                        email_summary += f"\n\nAttachments ({len(attachments)}):"
+                        output.write(f"\n\nAttachments ({len(attachments)}):")
                         for att in attachments:
                             size_kb = att["size"] / 1024 if att["size"] else 0
-                            email_summary += (
+                            output.write(
                                 f"\n  - {att['filename']} "
                                 f"({att['mimeType']}, {size_kb:.1f} KB, "
                                 f"attachmentId: {att['attachmentId']})"
                             )
 
-                email_summaries.append(email_summary)
-
-            result = f"Found {len(messages)} emails:\n\n" + "\n\n---\n\n".join(
-                email_summaries
-            )
-            return [TextContent(type="text", text=result)]
+            return [TextContent(type="text", text=output.getvalue())]
 
         elif name == "send_email":
             if not arguments or not all(
@@ -763,17 +1476,9 @@ def create_server(user_id, api_key=None):
                 attachments=arguments.get("attachments"),
             )
 
-            # Encode the message
-            raw_message = urlsafe_b64encode(message.as_bytes()).decode()
-
             # Send the message
             try:
-                sent_message = (
-                    gmail_service.users()
-                    .messages()
-                    .send(userId="me", body={"raw": raw_message})
-                    .execute()
-                )
+                sent_message = await send_message(gmail_service, message)
 
                 track_delivery = arguments.get("track_delivery", False)
 
@@ -789,7 +1494,7 @@ def create_server(user_id, api_key=None):
                     pubsub_topic = os.environ.get("GMAIL_PUBSUB_TOPIC")
                     if pubsub_topic:
                         try:
-                            watch_response = (
+                            watch_response = await asyncio.to_thread(
                                 gmail_service.users()
                                 .watch(
                                     userId="me",
@@ -799,7 +1504,7 @@ def create_server(user_id, api_key=None):
                                         "labelFilterBehavior": "INCLUDE",
                                     },
                                 )
-                                .execute()
+                                .execute
                             )
                             logger.info(
                                 f"Gmail watch active — historyId={watch_response.get('historyId')}, "
@@ -825,7 +1530,7 @@ def create_server(user_id, api_key=None):
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(result_data),
+                        text=to_json(result_data),
                     )
                 ]
             except Exception as e:
@@ -842,11 +1547,11 @@ def create_server(user_id, api_key=None):
 
             # Fetch the original email
             try:
-                original_msg = (
+                original_msg = await asyncio.to_thread(
                     gmail_service.users()
                     .messages()
                     .get(userId="me", id=email_id, format="full")
-                    .execute()
+                    .execute
                 )
             except Exception as e:
                 return [
@@ -856,53 +1561,57 @@ def create_server(user_id, api_key=None):
                 ]
 
             # Extract original headers
-            original_subject = "No Subject"
-            original_from = "Unknown"
-            original_date = "Unknown"
-            for header in original_msg.get("payload", {}).get("headers", []):
-                if header["name"] == "Subject":
-                    original_subject = header["value"]
-                elif header["name"] == "From":
-                    original_from = header["value"]
-                elif header["name"] == "Date":
-                    original_date = header["value"]
+            original_headers = extract_headers(original_msg, SUMMARY_HEADERS)
+            original_subject = original_headers.get("Subject", "No Subject")
+            original_from = original_headers.get("From", "Unknown")
+            original_date = original_headers.get("Date", "Unknown")
 
             # Parse original body
             payload = original_msg.get("payload", {})
-            body = parse_email_body(payload)
+            body = walk_payload(
+                payload, first_only=True, with_attachments=include_attachments
+            )
             original_body = body.get("text") or body.get("html") or "(No content)"
 
-            # Build forwarded message body
-            forward_body = ""
+            # Build forwarded message body in one join, so a long original body
+            # is copied only once
+            forward_parts = []
             if arguments.get("additional_message"):
-                forward_body = f"{arguments['additional_message']}\n\n"
-
-            forward_body += (
+                forward_parts.append(f"{arguments['additional_message']}\n\n")
+            forward_parts.append(
                 f"---------- Forwarded message ---------\n"
                 f"From: {original_from}\n"
                 f"Date: {original_date}\n"
                 f"Subject: {original_subject}\n\n"
-                f"{original_body}"
             )
+            forward_parts.append(original_body)
+            forward_body = "".join(forward_parts)
 
             # Prepare attachments if requested
             attachments_list = []
             if include_attachments:
-                attachments_info = get_attachments_info(payload)
-                for att_info in attachments_info:
-                    if att_info.get("attachmentId"):
-                        # Download the attachment
-                        att_data = download_attachment(
-                            gmail_service, "me", email_id, att_info["attachmentId"]
+                attachments_info = [
+                    att_info
+                    for att_info in body["attachments"]
+                    if att_info.get("attachmentId")
+                ]
+                # Download all attachments in batched calls
+                attachments_data = await download_attachments(
+                    gmail_service,
+                    "me",
+                    email_id,
+                    [att_info["attachmentId"] for att_info in attachments_info],
+                    mailbox=(server.user_id, server.api_key),
+                )
+                for att_info, att_data in zip(attachments_info, attachments_data):
+                    if att_data:
+                        attachments_list.append(
+                            {
+                                "filename": att_info["filename"],
+                                "content": att_data,
+                                "mimeType": att_info["mimeType"],
+                            }
                         )
-                        if att_data:
-                            attachments_list.append(
-                                {
-                                    "filename": att_info["filename"],
-                                    "content": base64.b64encode(att_data).decode(),
-                                    "mimeType": att_info["mimeType"],
-                                }
-                            )
 
             # Create and send the forwarded message
             forward_subject = (
@@ -920,16 +1629,8 @@ def create_server(user_id, api_key=None):
                 attachments=attachments_list if attachments_list else None,
             )
 
-            # Encode and send
-            raw_message = urlsafe_b64encode(message.as_bytes()).decode()
-
             try:
-                sent_message = (
-                    gmail_service.users()
-                    .messages()
-                    .send(userId="me", body={"raw": raw_message})
-                    .execute()
-                )
+                sent_message = await send_message(gmail_service, message)
 
                 attachment_info = ""
                 if attachments_list:
@@ -964,37 +1665,99 @@ def create_server(user_id, api_key=None):
 
             # Modify labels
             try:
-                result = (
+                mailbox = (server.user_id, server.api_key)
+                add_label_ids = await resolve_label_ids(
+                    gmail_service, mailbox, add_labels
+                )
+                remove_label_ids = await resolve_label_ids(
+                    gmail_service, mailbox, remove_labels
+                )
+                result = await asyncio.to_thread(
                     gmail_service.users()
                     .messages()
                     .modify(
                         userId="me",
                         id=email_id,
                         body={
-                            "addLabelIds": add_labels,
-                            "removeLabelIds": remove_labels,
+                            "addLabelIds": add_label_ids,
+                            "removeLabelIds": remove_label_ids,
                         },
                     )
-                    .execute()
+                    .execute
                 )
 
                 # Get updated labels
                 updated_labels = result.get("labelIds", [])
 
+                lines = [
+                    f"Successfully updated email {email_id}.",
+                    "Added labels: " + (", ".join(add_labels) or "None"),
+                    "Removed labels: " + (", ".join(remove_labels) or "None"),
+                    "Current labels: " + ", ".join(updated_labels),
+                ]
+                return [TextContent(type="text", text="\n".join(lines))]
+            except Exception as e:
+                return [
+                    TextContent(type="text", text=f"Failed to update email: {str(e)}")
+                ]
+
+        elif name == "batch_modify_emails":
+            if not arguments or not arguments.get("email_ids"):
+                raise ValueError("Missing email_ids parameter")
+
+            email_ids = arguments["email_ids"]
+            add_labels = arguments.get("add_labels", [])
+            remove_labels = arguments.get("remove_labels", [])
+
+            if not add_labels and not remove_labels:
                 return [
                     TextContent(
                         type="text",
-                        text=f"Successfully updated email {email_id}.\n"
-                        f"Added labels: {', '.join(add_labels) if add_labels else 'None'}\n"
-                        f"Removed labels: {', '.join(remove_labels) if remove_labels else 'None'}\n"
-                        f"Current labels: {', '.join(updated_labels)}",
+                        text="No label changes specified. Please provide labels to add or remove.",
                     )
                 ]
+
+            # One batchModify call per chunk of ids, run concurrently
+            try:
+                mailbox = (server.user_id, server.api_key)
+                add_label_ids = await resolve_label_ids(
+                    gmail_service, mailbox, add_labels
+                )
+                remove_label_ids = await resolve_label_ids(
+                    gmail_service, mailbox, remove_labels
+                )
+                await asyncio.gather(
+                    *(
+                        asyncio.to_thread(
+                            gmail_service.users()
+                            .messages()
+                            .batchModify(
+                                userId="me",
+                                body={
+                                    "ids": email_ids[
+                                        start : start + MAX_BATCH_MODIFY_IDS
+                                    ],
+                                    "addLabelIds": add_label_ids,
+                                    "removeLabelIds": remove_label_ids,
+                                },
+                            )
+                            .execute
+                        )
+                        for start in range(0, len(email_ids), MAX_BATCH_MODIFY_IDS)
+                    )
+                )
             except Exception as e:
                 return [
-                    TextContent(type="text", text=f"Failed to update email: {str(e)}")
+                    TextContent(type="text", text=f"Failed to update emails: {str(e)}")
                 ]
 
+            lines = [
+                f"Successfully updated {len(email_ids)} emails.",
+                "Added labels: " + (", ".join(add_labels) or "None"),
+                "Removed labels: " + (", ".join(remove_labels) or "None"),
+            ]
+            return [TextContent(type="text", text="\n".join(lines))]
+
         elif name == "get_attachment":
             if not arguments or not all(
                 k in arguments for k in ["email_id", "attachment_id"]
@@ -1004,10 +1767,41 @@ def create_server(user_id, api_key=None):
             email_id = arguments["email_id"]
             attachment_id = arguments["attachment_id"]
             filename = arguments["filename"]
-            mime_type = arguments.get("mime_type", "application/octet-stream")
+            mime_type = arguments.get("mime_type")
+            mailbox = (server.user_id, server.api_key)
 
-            # Download the attachment binary data directly
-            att_data = download_attachment(gmail_service, "me", email_id, attachment_id)
+            url_key = (mailbox, email_id, attachment_id, filename, mime_type)
+            cached_url = _download_url_cache.get(url_key)
+            if cached_url is not None:
+                download_url, mime_type, size, expires_at = cached_url
+                return [
+                    TextContent(
+                        type="text",
+                        text=format_attachment_link(
+                            filename, mime_type, size, download_url, expires_at
+                        ),
+                    )
+                ]
+
+            if not mime_type:
+                # Use the type seen when read_emails listed this attachment
+                known_types = _attachment_types_cache.get((mailbox, email_id), {})
+                mime_type = known_types.get(filename)
+
+            if mime_type:
+                att_data = await download_attachment(
+                    gmail_service, "me", email_id, attachment_id, mailbox=mailbox
+                )
+            else:
+                # Look up the type in the same batch call as the download
+                att_data, mime_type = await download_attachment_with_type(
+                    gmail_service,
+                    "me",
+                    email_id,
+                    attachment_id,
+                    filename,
+                    mailbox=mailbox,
+                )
             if not att_data:
                 return [
                     TextContent(
@@ -1016,13 +1810,17 @@ def create_server(user_id, api_key=None):
                     )
                 ]
 
-            # Upload to storage and get signed URL
+            # Upload to storage and get signed URL, off the event loop since
+            # large uploads block for a while
             try:
                 storage = get_storage_service()
-                download_url = storage.upload_temporary(
+                expires_at = time.time() + DOWNLOAD_URL_TTL
+                download_url = await asyncio.to_thread(
+                    storage.upload_temporary,
                     data=att_data,
                     filename=filename,
                     mime_type=mime_type,
+                    ttl_seconds=DOWNLOAD_URL_TTL,
                 )
             except Exception as e:
                 return [
@@ -1032,15 +1830,17 @@ def create_server(user_id, api_key=None):
                     )
                 ]
 
-            size_kb = len(att_data) / 1024
+            _download_url_cache[url_key] = (
+                download_url,
+                mime_type,
+                len(att_data),
+                expires_at,
+            )
             return [
                 TextContent(
                     type="text",
-                    text=(
-                        f"Attachment: {filename}\n"
-                        f"Type: {mime_type}\n"
-                        f"Size: {size_kb:.1f} KB\n"
-                        f"Download URL (expires in 1 hour): {download_url}"
+                    text=format_attachment_link(
+                        filename, mime_type, len(att_data), download_url, expires_at
                     ),
                 )
             ]
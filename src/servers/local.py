@@ -7,6 +7,7 @@ import importlib.util
 from pathlib import Path
 
 import mcp.server.stdio
+from dotenv import load_dotenv
 
 # Configure logging
 logging.basicConfig(
@@ -73,6 +74,9 @@ async def main():
 
     args = parser.parse_args()
 
+    # Server modules read .env-provided settings at import time
+    load_dotenv()
+
     logger.info(f"Loading server: {args.server}")
     server_creator, get_initialization_options = await load_server(args.server)
 
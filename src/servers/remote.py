@@ -14,6 +14,7 @@ from starlette.applications import Starlette
 from starlette.responses import JSONResponse, Response
 from starlette.types import Receive, Scope, Send
 from prometheus_client import Counter, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from dotenv import load_dotenv
 
 # Production mode: set DEBUG=true in environment to enable debug mode
 DEBUG_MODE = os.environ.get("DEBUG", "false").lower() == "true"
@@ -275,6 +276,9 @@ def main():
 
     args = parser.parse_args()
 
+    # Server modules read .env-provided settings at import time
+    load_dotenv()
+
     # Start metrics server in background
     metrics_thread = threading.Thread(
         target=run_metrics_server, args=(args.host, METRICS_PORT), daemon=True
@@ -0,0 +1,83 @@
+"""
+Unit tests for the auth client factory.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+# Add project root to path
+project_root = os.path.abspath(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+)
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, "src"))
+
+from auth.constants import SERVICE_NAME_MAP
+from auth.factory import clear_auth_client_cache, create_auth_client, get_auth_type
+from auth.clients.BaseAuthClient import BaseAuthClient
+
+
+class DummyAuthClient(BaseAuthClient):
+    def get_user_credentials(self, service_name, user_id):
+        return None
+
+
+class TestCreateAuthClient:
+    def setup_method(self):
+        clear_auth_client_cache()
+
+    def teardown_method(self):
+        clear_auth_client_cache()
+
+    def test_repeat_calls_return_cached_client(self):
+        first = create_auth_client(DummyAuthClient)
+        assert create_auth_client(DummyAuthClient) is first
+
+    def test_cache_clear_builds_new_client(self):
+        first = create_auth_client(DummyAuthClient)
+        clear_auth_client_cache()
+        assert create_auth_client(DummyAuthClient) is not first
+
+    def test_environment_selects_builder(self):
+        builder = MagicMock(return_value=DummyAuthClient())
+        with patch("auth.factory._environment", return_value="nango"), patch.dict(
+            "auth.factory._ENV_DISPATCH", {"nango": builder}
+        ):
+            client = create_auth_client(api_key="key-1")
+
+        builder.assert_called_once_with("key-1")
+        assert client is builder.return_value
+
+    def test_unknown_environment_falls_back_to_local(self):
+        builder = MagicMock(return_value=DummyAuthClient())
+        with patch("auth.factory._environment", return_value="staging"), patch(
+            "auth.factory._build_local", builder
+        ):
+            create_auth_client(api_key="key-1")
+
+        builder.assert_called_once_with("key-1")
+
+
+class TestGetAuthType:
+    def test_known_service(self):
+        assert get_auth_type("tldv") == "API_KEY"
+
+    def test_unknown_service_defaults_to_oauth2(self):
+        assert get_auth_type("not-a-service") == "oauth2"
+
+
+class TestServiceNameMap:
+    def test_entries_expose_attributes(self):
+        assert SERVICE_NAME_MAP["gmail"].nango_service_name == "google-mail"
+        assert SERVICE_NAME_MAP["gmail"].auth_type == "oauth2"
+
+    def test_non_oauth_services_are_mapped(self):
+        assert SERVICE_NAME_MAP["netsuite"].auth_type == "tba"
+        assert SERVICE_NAME_MAP["tldv"].auth_type == "API_KEY"
+        assert SERVICE_NAME_MAP["notion"].nango_service_name == "notion"
+
+    def test_map_is_read_only(self):
+        with pytest.raises(TypeError):
+            SERVICE_NAME_MAP["new-service"] = None
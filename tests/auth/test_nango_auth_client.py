@@ -0,0 +1,275 @@
+"""
+Unit tests for NangoAuthClient.
+
+These tests mock the pooled HTTP session so they run with no network access and
+verify how credentials are fetched, cached and saved.
+"""
+
+import json
+import pytest
+import time
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+# Add project root to path
+project_root = os.path.abspath(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+)
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, "src"))
+
+from auth.clients.NangoAuthClient import NangoAuthClient, get_default_client
+
+
+def _response(status_code=200, payload=None, text=""):
+    response = MagicMock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.content = json.dumps(payload or {}).encode()
+    response.text = text
+    return response
+
+
+@pytest.fixture
+def client():
+    NangoAuthClient._cache.clear()
+    nango_client = NangoAuthClient(secret_key="test-secret", host="https://nango.test")
+    yield nango_client
+    nango_client.close()
+    NangoAuthClient._cache.clear()
+
+
+class TestSession:
+    def test_session_carries_auth_header(self, client):
+        assert client._session.headers["Authorization"] == "Bearer test-secret"
+
+    def test_context_manager_closes_session(self):
+        nango_client = NangoAuthClient(secret_key="s", host="https://nango.test")
+        with patch.object(nango_client._session, "close") as close_mock:
+            with nango_client:
+                pass
+        close_mock.assert_called_once()
+
+    def test_requests_use_connect_and_read_timeouts(self):
+        nango_client = NangoAuthClient(
+            secret_key="s",
+            host="https://nango.test",
+            connect_timeout=1.5,
+            read_timeout=4.0,
+        )
+        with patch.object(
+            nango_client._session, "request", return_value=_response(status_code=404)
+        ) as get_mock:
+            nango_client.get_user_credentials("tldv", "conn-timeout")
+
+        assert get_mock.call_args.kwargs["timeout"] == (1.5, 4.0)
+        nango_client.close()
+
+
+class TestGetUserCredentials:
+    def test_oauth2_credentials_include_metadata(self, client):
+        payload = {
+            "credentials": {"access_token": "tok", "expires_at": 123.0},
+            "metadata": {"projectId": "proj"},
+        }
+        with patch.object(
+            client._session, "request", return_value=_response(payload=payload)
+        ) as get_mock:
+            creds = client.get_user_credentials("gmail", "conn-1")
+
+        assert creds["access_token"] == "tok"
+        assert creds["metadata"] == {"projectId": "proj"}
+        method, url = get_mock.call_args.args
+        assert method == "GET"
+        assert url == (
+            "https://nango.test/connection/conn-1?provider_config_key=google-mail"
+        )
+
+    def test_not_found_returns_none(self, client):
+        with patch.object(
+            client._session, "request", return_value=_response(status_code=404)
+        ):
+            assert client.get_user_credentials("gmail", "missing") is None
+
+    def test_transient_errors_are_retried(self, client):
+        payload = {"credentials": {"apiKey": "pk_123"}}
+        responses = [_response(status_code=503), _response(payload=payload)]
+        with patch.object(
+            client._session, "request", side_effect=responses
+        ) as get_mock, patch("auth.clients.NangoAuthClient.time.sleep") as sleep_mock:
+            creds = client.get_user_credentials("tldv", "conn-1")
+
+        assert creds == {"apiKey": "pk_123"}
+        assert get_mock.call_count == 2
+        sleep_mock.assert_called_once()
+
+    def test_permanent_errors_are_not_retried(self, client):
+        with patch.object(
+            client._session, "request", return_value=_response(status_code=401)
+        ) as get_mock, patch("auth.clients.NangoAuthClient.time.sleep") as sleep_mock:
+            assert client.get_user_credentials("tldv", "conn-1") is None
+
+        assert get_mock.call_count == 1
+        sleep_mock.assert_not_called()
+
+    def test_second_lookup_is_served_from_cache(self, client):
+        payload = {"credentials": {"apiKey": "pk_123"}}
+        with patch.object(
+            client._session, "request", return_value=_response(payload=payload)
+        ) as get_mock:
+            first = client.get_user_credentials("tldv", "conn-1")
+            second = client.get_user_credentials("tldv", "conn-1")
+
+        assert first == second == {"apiKey": "pk_123"}
+        assert get_mock.call_count == 1
+
+
+class TestSaveUserCredentials:
+    def test_put_sends_json_body(self, client):
+        with patch.object(
+            client._session, "request", return_value=_response()
+        ) as put_mock:
+            client.save_user_credentials("gmail", "conn-1", {"token": "abc"})
+
+        put_mock.assert_called_once()
+        assert put_mock.call_args.args == (
+            "PUT",
+            "https://nango.test/connection/google-mail/conn-1",
+        )
+        assert json.loads(put_mock.call_args.kwargs["data"]) == {"token": "abc"}
+        assert put_mock.call_args.kwargs["headers"] == {
+            "Content-Type": "application/json"
+        }
+
+    def test_objects_with_to_json_are_serialized(self, client):
+        class FakeCredentials:
+            def to_json(self):
+                return '{"token": "abc"}'
+
+        credentials = FakeCredentials()
+        with patch.object(
+            client._session, "request", return_value=_response()
+        ) as put_mock:
+            client.save_user_credentials("gmail", "conn-1", credentials)
+
+        assert json.loads(put_mock.call_args.kwargs["data"]) == '{"token": "abc"}'
+
+    def test_stdlib_json_fallback(self, client):
+        with patch("auth.clients.NangoAuthClient.orjson", None), patch.object(
+            client._session, "request", return_value=_response()
+        ) as put_mock:
+            client.save_user_credentials("gmail", "conn-1", {"token": "abc"})
+
+        assert json.loads(put_mock.call_args.kwargs["data"]) == {"token": "abc"}
+
+
+class TestGetOAuthConfig:
+    def test_provider_lookup_is_memoized(self, client):
+        NangoAuthClient.clear_provider_cache()
+        provider = {
+            "oauth_client_id": "cid",
+            "oauth_client_secret": "csecret",
+            "auth_url": "https://auth",
+            "token_url": "https://token",
+            "oauth_scopes": "a,b",
+        }
+        with patch(
+            "auth.clients.NangoAuthClient.requests.request",
+            return_value=_response(payload=provider),
+        ) as get_mock:
+            first = client.get_oauth_config("gmail")
+            second = client.get_oauth_config("gmail")
+
+        assert first == second
+        assert first["scopes"] == ["a", "b"]
+        assert get_mock.call_count == 1
+        NangoAuthClient.clear_provider_cache()
+
+    def test_failed_lookup_is_not_cached(self, client):
+        NangoAuthClient.clear_provider_cache()
+        with patch(
+            "auth.clients.NangoAuthClient.requests.request",
+            return_value=_response(status_code=400),
+        ) as get_mock:
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    client.get_oauth_config("gmail")
+
+        assert get_mock.call_count == 2
+
+
+class TestJWTFromMetadata:
+    def test_unauthenticated_connection_returns_signed_jwt(self, client):
+        import jwt
+
+        payload = {
+            "metadata": {
+                "tenantId": "tenant-1",
+                "privateKey": "a-shared-secret-of-at-least-32-bytes",
+                "accessToken": "acc-1",
+            }
+        }
+        with patch.object(
+            client._session, "request", return_value=_response(payload=payload)
+        ):
+            creds = client.get_user_credentials("peakflo", "conn-1")
+
+        decoded = jwt.decode(
+            creds["access_token"],
+            "a-shared-secret-of-at-least-32-bytes",
+            algorithms=["HS256"],
+            audience="peakflo",
+        )
+        assert decoded["sub"] == "tenant-1"
+        assert decoded["acc"] == "acc-1"
+
+
+class TestAsyncGetUserCredentialsMany:
+    async def test_results_follow_input_order(self, client):
+        async def fake_fetch(url, headers, service_name, connection_id, http_client):
+            assert http_client is not None
+            return _response(payload={"credentials": {"apiKey": connection_id}})
+
+        with patch.object(
+            client, "_async_fetch_connection_with_retries", side_effect=fake_fetch
+        ):
+            results = await client.async_get_user_credentials_many(
+                [("tldv", "conn-a"), ("tldv", "conn-b")]
+            )
+
+        assert results == [{"apiKey": "conn-a"}, {"apiKey": "conn-b"}]
+
+
+class TestCredentialsCache:
+    def test_cache_respects_token_expiry(self, client):
+        soon = time.time() + 30  # inside the safety margin
+        payload = {"credentials": {"access_token": "tok", "expires_at": soon}}
+        with patch.object(
+            client._session, "request", return_value=_response(payload=payload)
+        ) as get_mock:
+            client.get_user_credentials("gmail", "conn-1")
+            client.get_user_credentials("gmail", "conn-1")
+
+        assert get_mock.call_count == 2
+
+    def test_iso_expiry_is_parsed(self, client):
+        assert NangoAuthClient._credentials_expiry(
+            {"expires_at": "2030-01-01T00:00:00.000Z"}
+        ) == pytest.approx(1893456000.0)
+
+    def test_invalidate_drops_entry(self, client):
+        payload = {"credentials": {"apiKey": "pk_123"}}
+        with patch.object(
+            client._session, "request", return_value=_response(payload=payload)
+        ) as get_mock:
+            client.get_user_credentials("tldv", "conn-1")
+            client.invalidate("tldv", "conn-1")
+            client.get_user_credentials("tldv", "conn-1")
+
+        assert get_mock.call_count == 2
+
+
+class TestDefaultClient:
+    def test_default_client_is_shared(self):
+        assert get_default_client() is get_default_client()
@@ -0,0 +1,220 @@
+"""Unit tests for batching and caching Gmail API requests.
+
+These tests use a fake batch object so request grouping and failure handling
+can be verified without real credentials.
+"""
+
+from base64 import urlsafe_b64encode
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.servers.gmail import main as gmail_main
+from src.servers.gmail.main import (
+    MAX_BATCH_REQUESTS,
+    MAX_REQUEST_RETRIES,
+    _attachment_cache,
+    _label_ids_cache,
+    download_attachment_with_type,
+    download_attachments,
+    execute_batch,
+    resolve_label_ids,
+)
+from tests.utils.gmail_fakes import FakeBatch
+
+
+class _UnavailableBatch(FakeBatch):
+    """Batch whose HTTP call fails before any request is answered."""
+
+    def execute(self):
+        raise ConnectionError("batch endpoint unavailable")
+
+
+def _build_service(batches, batch_class=FakeBatch):
+    """Gmail service mock recording every batch it creates."""
+
+    def new_batch_http_request(callback=None):
+        batch = batch_class(callback)
+        batches.append(batch)
+        return batch
+
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = new_batch_http_request
+    return service
+
+
+class _RateLimitError(Exception):
+    """Error shaped like HttpError for a 429 rateLimitExceeded response."""
+
+    def __init__(self):
+        super().__init__("rateLimitExceeded")
+        self.resp = MagicMock(status=429)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(gmail_main, "RETRY_INITIAL_DELAY", 0.0)
+
+
+def _request(response=None, error=None):
+    request = MagicMock()
+    if error is not None:
+        request.execute.side_effect = error
+    else:
+        request.execute.return_value = response
+    return request
+
+
+async def test_responses_follow_request_order():
+    batches = []
+    service = _build_service(batches)
+    requests = [_request({"id": str(i)}) for i in range(3)]
+
+    responses = await execute_batch(service, requests)
+
+    assert responses == [{"id": "0"}, {"id": "1"}, {"id": "2"}]
+    assert len(batches) == 1
+
+
+async def test_requests_are_split_at_batch_limit():
+    batches = []
+    service = _build_service(batches)
+    requests = [_request({"id": str(i)}) for i in range(MAX_BATCH_REQUESTS + 1)]
+
+    responses = await execute_batch(service, requests)
+
+    assert len(batches) == 2
+    assert responses[-1] == {"id": str(MAX_BATCH_REQUESTS)}
+
+
+async def test_failed_request_returns_none():
+    batches = []
+    service = _build_service(batches)
+    requests = [_request({"id": "ok"}), _request(error=RuntimeError("boom"))]
+
+    assert await execute_batch(service, requests) == [{"id": "ok"}, None]
+
+
+async def test_rate_limited_request_is_retried():
+    batches = []
+    service = _build_service(batches)
+    request = _request()
+    request.execute.side_effect = [_RateLimitError(), {"id": "late"}]
+
+    assert await execute_batch(service, [_request({"id": "ok"}), request]) == [
+        {"id": "ok"},
+        {"id": "late"},
+    ]
+    assert request.execute.call_count == 2
+
+
+async def test_retries_stop_after_limit():
+    batches = []
+    service = _build_service(batches)
+    request = _request(error=_RateLimitError())
+
+    assert await execute_batch(service, [request]) == [None]
+    assert request.execute.call_count == 1 + MAX_REQUEST_RETRIES
+
+
+async def test_other_errors_are_not_retried():
+    batches = []
+    service = _build_service(batches)
+    request = _request(error=RuntimeError("boom"))
+
+    assert await execute_batch(service, [request]) == [None]
+    request.execute.assert_called_once()
+
+
+async def test_no_requests_skips_batch_call():
+    batches = []
+    service = _build_service(batches)
+
+    assert await execute_batch(service, []) == []
+    assert batches == []
+
+
+async def test_failed_batch_call_falls_back_to_single_requests():
+    batches = []
+    service = _build_service(batches, batch_class=_UnavailableBatch)
+    requests = [_request({"id": "a"}), _request(error=RuntimeError("boom"))]
+
+    assert await execute_batch(service, requests) == [{"id": "a"}, None]
+    requests[0].execute.assert_called_once()
+
+
+async def test_single_request_limit_is_shared_per_service():
+    service = _build_service([], batch_class=_UnavailableBatch)
+
+    await execute_batch(service, [_request({"id": "a"})])
+    semaphore = gmail_main._request_semaphores[service]
+    await execute_batch(service, [_request({"id": "b"})])
+
+    assert gmail_main._request_semaphores[service] is semaphore
+
+
+async def test_attachment_downloads_are_cached_per_mailbox():
+    _attachment_cache.clear()
+    batches = []
+    service = _build_service(batches)
+    attachment = {"data": urlsafe_b64encode(b"hello").decode()}
+    service.users().messages().attachments().get.return_value = _request(attachment)
+
+    first = await download_attachments(
+        service, "me", "msg_001", ["att_001"], mailbox=("user", None)
+    )
+    second = await download_attachments(
+        service, "me", "msg_001", ["att_001"], mailbox=("user", None)
+    )
+
+    assert first == second == [b"hello"]
+    assert len(batches) == 1
+    _attachment_cache.clear()
+
+
+async def test_attachment_type_is_fetched_in_the_download_batch():
+    _attachment_cache.clear()
+    batches = []
+    service = _build_service(batches)
+    messages = service.users().messages()
+    messages.get.return_value = _request(
+        {
+            "payload": {
+                "parts": [
+                    {"filename": "", "mimeType": "text/plain"},
+                    {"filename": "report.pdf", "mimeType": "application/pdf"},
+                ]
+            }
+        }
+    )
+    messages.attachments().get.return_value = _request(
+        {"data": urlsafe_b64encode(b"%PDF").decode()}
+    )
+
+    data, mime_type = await download_attachment_with_type(
+        service, "me", "msg_001", "att_001", "report.pdf"
+    )
+
+    assert (data, mime_type) == (b"%PDF", "application/pdf")
+    assert len(batches) == 1
+
+
+async def test_label_names_are_resolved_from_one_listing():
+    _label_ids_cache.clear()
+    service = _build_service([])
+    service.users().labels().list.return_value = _request(
+        {
+            "labels": [
+                {"id": "Label_1", "name": "Work"},
+                {"id": "INBOX", "name": "INBOX"},
+            ]
+        }
+    )
+
+    first = await resolve_label_ids(service, ("user", None), ["Work", "INBOX"])
+    second = await resolve_label_ids(service, ("user", None), ["Label_1", "Other"])
+
+    assert first == ["Label_1", "INBOX"]
+    assert second == ["Label_1", "Other"]
+    service.users().labels().list.return_value.execute.assert_called_once()
+    _label_ids_cache.clear()
@@ -11,6 +11,9 @@ from base64 import urlsafe_b64encode
 
 from mcp.types import CallToolRequest, CallToolRequestParams
 
+from src.servers.gmail.main import MESSAGE_LIST_FIELDS, _attachment_types_cache
+from tests.utils.gmail_fakes import FakeBatch
+
 # Default structured arguments — query is required for read_emails
 _STRUCTURED_DEFAULTS = {"query": "in:inbox", "output_format": "structured"}
 
@@ -94,6 +97,7 @@ def _make_gmail_message(
 def _build_mock_gmail_service(messages_list_response, message_get_responses):
     """Build a mock Gmail service with list and get responses."""
     mock_service = MagicMock()
+    mock_service.new_batch_http_request.side_effect = FakeBatch
 
     mock_list = MagicMock()
     mock_list.execute.return_value = messages_list_response
@@ -149,6 +153,18 @@ def multi_email_service():
     )
 
 
+@pytest.fixture
+def partially_failed_service():
+    """Gmail service mock where the second email cannot be fetched."""
+    return _build_mock_gmail_service(
+        messages_list_response={"messages": [{"id": "msg_001"}, {"id": "msg_002"}]},
+        message_get_responses=[
+            _make_gmail_message(),
+            RuntimeError("Requested entity was not found."),
+        ],
+    )
+
+
 @pytest.fixture
 def empty_service():
     """Gmail service mock returning no emails."""
@@ -321,6 +337,17 @@ async def test_attachments_included(email_with_attachments_service):
     assert png["filename"] == "photo.png"
 
 
+@pytest.mark.asyncio
+async def test_attachment_types_are_remembered(email_with_attachments_service):
+    """Listed attachment types are kept for get_attachment calls without mime_type."""
+    _attachment_types_cache.clear()
+    await _invoke_tool(email_with_attachments_service)
+
+    known_types = _attachment_types_cache[(("test_user", "test_key"), "msg_att")]
+    assert known_types == {"report.pdf": "application/pdf", "photo.png": "image/png"}
+    _attachment_types_cache.clear()
+
+
 @pytest.mark.asyncio
 async def test_attachments_excluded_when_disabled(
     email_with_attachments_service,
@@ -335,6 +362,20 @@ async def test_attachments_excluded_when_disabled(
     assert "attachments" not in email
 
 
+@pytest.mark.asyncio
+async def test_metadata_format_without_body_or_attachments(single_email_service):
+    """Only headers are fetched when neither body nor attachments are requested."""
+    data = await _invoke_tool(
+        single_email_service,
+        {"include_body": False, "include_attachments_info": False},
+    )
+
+    assert data["emails"][0]["subject"] == "Test Subject"
+    get_kwargs = single_email_service.users().messages().get.call_args.kwargs
+    assert get_kwargs["format"] == "metadata"
+    assert "Subject" in get_kwargs["metadataHeaders"]
+
+
 @pytest.mark.asyncio
 async def test_custom_query(single_email_service):
     """Custom query parameter is passed to Gmail API and reflected in response."""
@@ -345,7 +386,10 @@ async def test_custom_query(single_email_service):
     # Verify the query was passed to the API
     mock_messages = single_email_service.users().messages()
     mock_messages.list.assert_called_with(
-        userId="me", q="from:alice@example.com", maxResults=10
+        userId="me",
+        q="from:alice@example.com",
+        maxResults=10,
+        fields=MESSAGE_LIST_FIELDS,
     )
 
 
@@ -362,6 +406,7 @@ async def test_label_ids_filter(single_email_service):
         userId="me",
         q="in:inbox",
         maxResults=10,
+        fields=MESSAGE_LIST_FIELDS,
         labelIds=["INBOX", "UNREAD"],
     )
 
@@ -439,3 +484,20 @@ async def test_text_format_explicit(single_email_service):
     raw = await _invoke_tool_raw(single_email_service, {"output_format": "text"})
     assert "Found 1 emails:" in raw
     assert "From: alice@example.com" in raw
+
+
+@pytest.mark.asyncio
+async def test_unfetched_emails_are_reported(partially_failed_service):
+    """Emails that could not be fetched are listed instead of dropped."""
+    data = await _invoke_tool(partially_failed_service)
+
+    assert data["resultCount"] == 1
+    assert data["failedIds"] == ["msg_002"]
+
+
+@pytest.mark.asyncio
+async def test_unfetched_emails_are_reported_in_text(partially_failed_service):
+    """Text output names the emails that could not be fetched."""
+    raw = await _invoke_tool_raw(partially_failed_service)
+
+    assert raw.startswith("Found 2 emails, 1 could not be fetched (IDs: msg_002):")
@@ -0,0 +1,168 @@
+"""Unit tests for reading headers, bodies and attachments from Gmail payloads."""
+
+from base64 import urlsafe_b64encode
+
+from src.servers.gmail.main import (
+    MAX_MIME_DEPTH,
+    SUMMARY_HEADERS,
+    extract_headers,
+    walk_payload,
+)
+
+
+def _encode(text):
+    return urlsafe_b64encode(text.encode()).decode()
+
+
+def _text_part(mime_type, text):
+    return {"mimeType": mime_type, "filename": "", "body": {"data": _encode(text)}}
+
+
+def test_single_part_message():
+    content = walk_payload(_text_part("text/plain", "Hello"))
+
+    assert content == {"text": "Hello", "html": "", "attachments": []}
+
+
+def test_nested_body_and_attachments_in_one_pass():
+    payload = {
+        "mimeType": "multipart/mixed",
+        "parts": [
+            {
+                "mimeType": "multipart/alternative",
+                "parts": [
+                    _text_part("text/plain", "Plain"),
+                    _text_part("text/html", "<p>Html</p>"),
+                ],
+            },
+            {
+                "mimeType": "application/pdf",
+                "filename": "invoice.pdf",
+                "body": {"size": 2048, "attachmentId": "att_001"},
+            },
+        ],
+    }
+
+    content = walk_payload(payload)
+
+    assert content["text"] == "Plain"
+    assert content["html"] == "<p>Html</p>"
+    assert content["attachments"] == [
+        {
+            "filename": "invoice.pdf",
+            "mimeType": "application/pdf",
+            "size": 2048,
+            "attachmentId": "att_001",
+        }
+    ]
+
+
+def test_named_text_part_is_an_attachment():
+    payload = {
+        "mimeType": "multipart/mixed",
+        "parts": [
+            _text_part("text/plain", "Body"),
+            dict(_text_part("text/plain", "notes"), filename="notes.txt"),
+        ],
+    }
+
+    content = walk_payload(payload)
+
+    assert content["text"] == "Body"
+    assert [att["filename"] for att in content["attachments"]] == ["notes.txt"]
+
+
+def test_nesting_beyond_depth_limit_is_ignored():
+    payload = _text_part("text/plain", "Too deep")
+    for _ in range(MAX_MIME_DEPTH + 1):
+        payload = {"mimeType": "multipart/mixed", "parts": [payload]}
+
+    assert walk_payload(payload)["text"] == ""
+
+
+def test_first_only_skips_decoding_the_html_body():
+    payload = {
+        "mimeType": "multipart/alternative",
+        "parts": [
+            _text_part("text/plain", "Plain"),
+            {"mimeType": "text/html", "filename": "", "body": {"data": "!not-b64"}},
+        ],
+    }
+
+    content = walk_payload(payload, first_only=True)
+
+    assert content["text"] == "Plain"
+    assert content["html"] == ""
+
+
+def test_html_is_used_when_there_is_no_text_body():
+    content = walk_payload(_text_part("text/html", "<p>Hi</p>"), first_only=True)
+
+    assert content["html"] == "<p>Hi</p>"
+
+
+def test_attachments_keep_message_order():
+    def attachment(name):
+        return {"mimeType": "application/pdf", "filename": name, "body": {}}
+
+    payload = {
+        "mimeType": "multipart/mixed",
+        "parts": [
+            {"mimeType": "multipart/related", "parts": [attachment("a.pdf")]},
+            attachment("b.pdf"),
+            {"mimeType": "multipart/mixed", "parts": [attachment("c.pdf")]},
+        ],
+    }
+
+    attachments = walk_payload(payload)["attachments"]
+
+    assert [att["filename"] for att in attachments] == ["a.pdf", "b.pdf", "c.pdf"]
+
+
+def test_extract_headers_keeps_only_wanted_headers():
+    msg = {
+        "payload": {
+            "headers": [
+                {"name": "Subject", "value": "Hi"},
+                {"name": "To", "value": "a@example.com"},
+                {"name": "From", "value": "b@example.com"},
+                {"name": "Date", "value": "Mon, 1 Jan 2024"},
+                {"name": "Subject", "value": "Duplicate"},
+            ]
+        }
+    }
+
+    assert extract_headers(msg, SUMMARY_HEADERS) == {
+        "Subject": "Hi",
+        "From": "b@example.com",
+        "Date": "Mon, 1 Jan 2024",
+    }
+    assert extract_headers(msg)["To"] == "a@example.com"
+
+
+def test_declared_charset_is_used_for_non_utf8_bodies():
+    part = {
+        "mimeType": "text/plain",
+        "filename": "",
+        "headers": [
+            {"name": "Content-Type", "value": 'text/plain; charset="ISO-8859-1"'}
+        ],
+        "body": {"data": urlsafe_b64encode("Café".encode("latin-1")).decode()},
+    }
+
+    assert walk_payload(part)["text"] == "Café"
+
+
+def test_walk_stops_at_preferred_body_without_attachments():
+    payload = {
+        "mimeType": "multipart/mixed",
+        "parts": [
+            _text_part("text/plain", "First"),
+            _text_part("text/plain", "Quoted"),
+            {"mimeType": "application/pdf", "filename": "a.pdf", "body": {}},
+        ],
+    }
+
+    content = walk_payload(payload, first_only=True, with_attachments=False)
+
+    assert content == {"text": "First", "html": "", "attachments": []}
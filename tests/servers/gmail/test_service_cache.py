@@ -0,0 +1,111 @@
+"""Unit tests for caching Gmail service instances across tool calls.
+
+Credential loading and service discovery are mocked, so these tests only
+check when a service is rebuilt.
+"""
+
+import datetime
+import threading
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.servers.gmail import main as gmail_main
+
+
+@pytest.fixture(autouse=True)
+def clear_service_cache():
+    gmail_main._service_cache.clear()
+    yield
+    gmail_main._service_cache.clear()
+
+
+@pytest.fixture
+def mock_build():
+    credentials = MagicMock(expiry=None)
+    with patch.object(
+        gmail_main, "get_credentials", new_callable=AsyncMock, return_value=credentials
+    ), patch.object(
+        gmail_main, "_gmail_discovery_document", return_value="{}"
+    ), patch.object(
+        gmail_main,
+        "build_from_document",
+        side_effect=lambda *args, **kwargs: MagicMock(),
+    ) as build_mock:
+        yield build_mock
+
+
+async def test_service_is_reused_for_same_user(mock_build):
+    first = await gmail_main.create_gmail_service("user-1", api_key="key")
+    second = await gmail_main.create_gmail_service("user-1", api_key="key")
+
+    assert first is second
+    assert mock_build.call_count == 1
+
+
+async def test_services_are_separate_per_user(mock_build):
+    first = await gmail_main.create_gmail_service("user-1", api_key="key")
+    second = await gmail_main.create_gmail_service("user-2", api_key="key")
+
+    assert first is not second
+    assert mock_build.call_count == 2
+
+
+async def test_expired_service_is_rebuilt(mock_build):
+    first = await gmail_main.create_gmail_service("user-1")
+    _, service = gmail_main._service_cache[("user-1", None)]
+    gmail_main._service_cache[("user-1", None)] = (0.0, service)
+
+    second = await gmail_main.create_gmail_service("user-1")
+
+    assert first is not second
+    assert mock_build.call_count == 2
+
+
+async def test_build_lock_is_released_after_build(mock_build):
+    await gmail_main.create_gmail_service("user-1")
+
+    assert ("user-1", None) not in gmail_main._service_locks
+
+
+def test_expiry_honours_token_expiry():
+    token_expires_at = datetime.datetime.now(datetime.timezone.utc).timestamp() + 90
+    expiry = datetime.datetime.utcfromtimestamp(token_expires_at)
+
+    expires_at = gmail_main._service_cache_expiry(MagicMock(expiry=expiry))
+
+    assert expires_at == pytest.approx(
+        token_expires_at - gmail_main.SERVICE_EXPIRY_MARGIN
+    )
+
+
+def test_threads_get_separate_connections():
+    http = gmail_main.ThreadLocalAuthorizedHttp(MagicMock())
+    main_thread_http = http._http()
+    worker_http = []
+    worker = threading.Thread(target=lambda: worker_http.append(http._http()))
+    worker.start()
+    worker.join()
+
+    assert http._http() is main_thread_http
+    assert worker_http[0] is not main_thread_http
+    assert worker_http[0].credentials is main_thread_http.credentials
+
+
+async def test_service_is_built_with_orjson_model(mock_build):
+    await gmail_main.create_gmail_service("user-1")
+
+    assert isinstance(mock_build.call_args.kwargs["model"], gmail_main.OrjsonModel)
+
+
+def test_orjson_model_parses_responses():
+    model = gmail_main.OrjsonModel()
+
+    assert model.deserialize(b'{"id": "msg_001"}') == {"id": "msg_001"}
+
+
+def test_services_share_connections_within_a_thread():
+    first = gmail_main.ThreadLocalAuthorizedHttp(MagicMock())
+    second = gmail_main.ThreadLocalAuthorizedHttp(MagicMock())
+
+    assert first._http() is not second._http()
+    assert first._http().http is second._http().http
@@ -105,3 +105,31 @@ async def test_update_email(client):
     print(f"\t{response}")
 
     print("✅ Update email tool working")
+
+
+@pytest.mark.asyncio
+async def test_batch_modify_emails(client):
+    """Test updating labels on several emails at once"""
+    list_response = await client.list_resources()
+    assert len(list_response.resources) > 0, "No emails found to test with"
+
+    email_ids = [
+        str(resource.uri).replace("gmail:///", "")
+        for resource in list_response.resources[:2]
+    ]
+
+    response = await client.process_query(
+        f"""Use the batch_modify_emails tool to mark these emails as read with these parameters:
+        email_ids: {email_ids}
+        remove_labels: ["UNREAD"]
+        If it works successfuly start your response with 'Successfully updated'"""
+    )
+
+    assert (
+        "successfully updated" in response.lower()
+    ), f"Failed to batch modify emails: {response}"
+
+    print("Batch modify emails response:")
+    print(f"\t{response}")
+
+    print("✅ Batch modify emails tool working")
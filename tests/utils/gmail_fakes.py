@@ -0,0 +1,24 @@
+"""Fakes shared by the Gmail server unit tests."""
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that executes requests one by one.
+
+    Like the real batch, a failing request is passed to its callback as the
+    exception instead of failing the whole batch.
+    """
+
+    def __init__(self, callback=None):
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self._requests.append((request, callback or self._callback, request_id))
+
+    def execute(self):
+        for request, callback, request_id in self._requests:
+            try:
+                response, exception = request.execute(), None
+            except Exception as e:
+                response, exception = None, e
+            callback(request_id, response, exception)